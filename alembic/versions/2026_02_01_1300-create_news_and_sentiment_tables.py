@@ -0,0 +1,65 @@
+"""create news_articles and sentiment_analyses tables
+
+These tables predate the migration history and were only ever created by
+Base.metadata.create_all, so existing databases may already have them.
+
+Revision ID: create_news_and_sentiment
+Revises: add_price_predictions
+Create Date: 2026-02-01 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'create_news_and_sentiment'
+down_revision: Union[str, None] = 'add_price_predictions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create news_articles and sentiment_analyses if they don't exist yet."""
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS news_articles (
+            id SERIAL NOT NULL,
+            title VARCHAR(500) NOT NULL,
+            content TEXT NOT NULL,
+            source VARCHAR(200) NOT NULL,
+            url VARCHAR(1000) NOT NULL,
+            author VARCHAR(200),
+            published_at TIMESTAMP WITHOUT TIME ZONE,
+            category VARCHAR(100),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            PRIMARY KEY (id),
+            UNIQUE (url)
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sentiment_analyses (
+            id SERIAL NOT NULL,
+            news_article_id INTEGER NOT NULL,
+            sentiment_label VARCHAR(50) NOT NULL,
+            sentiment_score FLOAT NOT NULL,
+            confidence FLOAT NOT NULL,
+            model_version VARCHAR(50) NOT NULL,
+            analysis_metadata TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            PRIMARY KEY (id),
+            FOREIGN KEY(news_article_id) REFERENCES news_articles (id) ON DELETE CASCADE
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop sentiment_analyses and news_articles."""
+    op.execute("DROP TABLE IF EXISTS sentiment_analyses")
+    op.execute("DROP TABLE IF EXISTS news_articles")
@@ -0,0 +1,35 @@
+"""add full-text search vector to news articles
+
+Revision ID: add_news_search_vector
+Revises: create_news_and_sentiment
+Create Date: 2026-02-02 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_news_search_vector'
+down_revision: Union[str, None] = 'create_news_and_sentiment'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add generated tsvector column and GIN index to news_articles."""
+    # IF NOT EXISTS: the table may already have been created by Base.metadata.create_all
+    op.execute(
+        "ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS search_vec tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS news_search_gin ON news_articles USING GIN (search_vec)"
+    )
+
+
+def downgrade() -> None:
+    """Drop news_articles search vector and its index."""
+    op.execute("DROP INDEX IF EXISTS news_search_gin")
+    op.execute("ALTER TABLE news_articles DROP COLUMN IF EXISTS search_vec")
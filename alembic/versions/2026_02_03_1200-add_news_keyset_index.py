@@ -0,0 +1,30 @@
+"""add keyset pagination index to news articles
+
+Revision ID: add_news_keyset_index
+Revises: add_news_search_vector
+Create Date: 2026-02-03 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_news_keyset_index'
+down_revision: Union[str, None] = 'add_news_search_vector'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (category, created_at DESC, id DESC) index for cursor pagination."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_news_category_created_at_id "
+        "ON news_articles (category, created_at DESC, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop news_articles keyset pagination index."""
+    op.execute("DROP INDEX IF EXISTS idx_news_category_created_at_id")
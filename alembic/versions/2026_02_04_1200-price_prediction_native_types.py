@@ -0,0 +1,63 @@
+"""store price prediction key factors and sentiment summary natively
+
+Revision ID: price_prediction_native_types
+Revises: add_news_keyset_index
+Create Date: 2026-02-04 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'price_prediction_native_types'
+down_revision: Union[str, None] = 'add_news_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _column_type(column: str) -> str | None:
+    """Return the information_schema data_type of a price_predictions column."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND table_name = 'price_predictions' AND column_name = :column"
+        ),
+        {"column": column},
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Convert key_factors to VARCHAR[] and sentiment_summary to JSONB."""
+    # Skip columns that already have the native type so a re-run is harmless
+    if _column_type("sentiment_summary") != "jsonb":
+        op.execute(
+            "ALTER TABLE price_predictions "
+            "ALTER COLUMN sentiment_summary TYPE JSONB USING sentiment_summary::jsonb"
+        )
+
+    if _column_type("key_factors") != "ARRAY":
+        # ALTER ... USING cannot contain a subquery, so unpack the JSON array via a new column
+        op.execute("ALTER TABLE price_predictions ADD COLUMN key_factors_arr VARCHAR[]")
+        op.execute(
+            "UPDATE price_predictions SET key_factors_arr = "
+            "ARRAY(SELECT json_array_elements_text(key_factors::json))"
+        )
+        op.execute("ALTER TABLE price_predictions DROP COLUMN key_factors")
+        op.execute("ALTER TABLE price_predictions RENAME COLUMN key_factors_arr TO key_factors")
+        op.execute("ALTER TABLE price_predictions ALTER COLUMN key_factors SET NOT NULL")
+
+
+def downgrade() -> None:
+    """Convert key_factors and sentiment_summary back to JSON text."""
+    op.execute(
+        "ALTER TABLE price_predictions "
+        "ALTER COLUMN key_factors TYPE TEXT USING array_to_json(key_factors)::text"
+    )
+    op.execute(
+        "ALTER TABLE price_predictions "
+        "ALTER COLUMN sentiment_summary TYPE TEXT USING sentiment_summary::text"
+    )
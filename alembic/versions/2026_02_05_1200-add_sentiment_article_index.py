@@ -0,0 +1,30 @@
+"""add (news_article_id, created_at) index to sentiment analyses
+
+Revision ID: add_sentiment_article_index
+Revises: price_prediction_native_types
+Create Date: 2026-02-05 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_sentiment_article_index'
+down_revision: Union[str, None] = 'price_prediction_native_types'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create (news_article_id, created_at DESC) index for latest-analysis lookups."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sentiment_news_article_created_at "
+        "ON sentiment_analyses (news_article_id, created_at DESC)"
+    )
+
+
+def downgrade() -> None:
+    """Drop sentiment_analyses article index."""
+    op.execute("DROP INDEX IF EXISTS idx_sentiment_news_article_created_at")
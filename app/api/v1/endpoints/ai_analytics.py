@@ -103,13 +103,10 @@ async def analyze_batch_texts(
             detail="Maximum 10 texts allowed per batch request",
         )
 
-    results = []
-    for text in texts:
-        request = SentimentAnalysisRequest(text=text)
-        result = await sentiment_service.analyze_text(request)
-        results.append(result)
-
-    return results
+    # One OpenAI request covers the whole batch
+    return await sentiment_service.analyze_texts_batch(
+        [SentimentAnalysisRequest(text=text) for text in texts]
+    )
 
 
 @router.get("/news/{article_id}/latest", response_model=SentimentAnalysisResponse)
@@ -214,8 +211,9 @@ async def predict_price_from_news(
         
         # Save prediction to DB for caching (used by predict-price-poll)
         try:
-            await price_prediction_crud.create_from_prediction_result(db, prediction)
+            saved = await price_prediction_crud.create_from_prediction_result(db, prediction)
             await db.commit()
+            long_polling_service.notify_new_prediction(saved.symbol, saved)
         except Exception as save_err:
             import structlog
             structlog.get_logger().warning(
@@ -259,7 +257,7 @@ async def predict_price_long_polling(
     
     **Benefits:**
     - Reduces OpenAI API calls by caching predictions (5 minute cache)
-    - Efficient polling mechanism (checks every 5 seconds)
+    - Event-driven wait: held requests are woken as soon as a new prediction is saved
     - Saves costs by reusing recent predictions
     
     **Parameters:**
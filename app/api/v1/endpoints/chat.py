@@ -83,6 +83,7 @@ async def chat(
         assistant_message = await chat_service.chat(
             user_message=request.message,
             conversation_history=history[:-1],  # Don't include the message we just added
+            conversation_id=conversation_id,
         )
 
         # Add assistant message to history
@@ -149,6 +150,7 @@ async def clear_conversation(
             detail="This feature is only available for VIP users.",
         )
 
+    chat_service.forget_conversation(conversation_id)
     if conversation_id in conversations:
         del conversations[conversation_id]
         logger.info("Conversation cleared", conversation_id=conversation_id)
@@ -1,23 +1,30 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
 
 from app.core.config import settings
+from app.core.responses import StaticJSONResponse
 from app.schemas.common import HealthResponse
 
 router = APIRouter()
 
+# Constant for the life of the process, so serialized once
+_HEALTH_RESPONSE = StaticJSONResponse(
+    HealthResponse(
+        status="healthy",
+        version=settings.APP_VERSION,
+        environment=settings.ENVIRONMENT,
+    ).model_dump(mode="json")
+)
+
 
 @router.get("", response_model=HealthResponse)
 @router.get("/", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint.
 
     Returns the current status of the API service.
     """
-    return HealthResponse(
-        status="healthy",
-        version=settings.APP_VERSION,
-        environment=settings.ENVIRONMENT,
-    )
+    return _HEALTH_RESPONSE(request)
@@ -2,7 +2,12 @@
 
 from fastapi import APIRouter, HTTPException, status
 
-from app.schemas.html_parser import HTMLParseRequest, HTMLParseResponse
+from app.schemas.html_parser import (
+    HTMLParseBatchRequest,
+    HTMLParseBatchResponse,
+    HTMLParseRequest,
+    HTMLParseResponse,
+)
 from app.services.html_parser_service import html_parser_service
 
 router = APIRouter()
@@ -50,3 +55,57 @@ async def parse_html(request: HTMLParseRequest) -> HTMLParseResponse:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to parse HTML: {str(e)}",
         )
+
+
+@router.post(
+    "/parse-html/batch",
+    response_model=HTMLParseBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_parse_html_batch(request: HTMLParseBatchRequest) -> HTMLParseBatchResponse:
+    """
+    Queue HTML documents for parsing through the OpenAI Batch API.
+
+    Intended for background crawls that do not need results immediately:
+    batch jobs cost half as much as synchronous parsing and complete within
+    24 hours. Poll GET /parse-html/batch/{batch_id} for the results.
+
+    Args:
+        request: HTMLParseBatchRequest containing the documents to parse
+
+    Returns:
+        HTMLParseBatchResponse with the batch ID
+    """
+    try:
+        batch_id = await html_parser_service.submit_batch(request.requests)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit HTML parse batch: {str(e)}",
+        )
+    return HTMLParseBatchResponse(batch_id=batch_id, status="validating")
+
+
+@router.get("/parse-html/batch/{batch_id}", response_model=HTMLParseBatchResponse)
+async def get_parse_html_batch(batch_id: str) -> HTMLParseBatchResponse:
+    """
+    Get the status of a batch HTML parsing job and its results once completed.
+
+    Args:
+        batch_id: ID returned when the batch was submitted
+
+    Returns:
+        HTMLParseBatchResponse with status and, when completed, ordered results
+    """
+    try:
+        batch_status, results = await html_parser_service.get_batch_results(batch_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch HTML parse batch: {str(e)}",
+        )
+    return HTMLParseBatchResponse(batch_id=batch_id, status=batch_status, results=results)
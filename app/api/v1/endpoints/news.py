@@ -1,5 +1,6 @@
 """News article endpoints."""
 
+from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -8,6 +9,7 @@ from app.core.dependencies import DBSession
 from app.schemas.common import MessageResponse
 from app.schemas.news import (
     NewsArticleCreate,
+    NewsArticleCursorPage,
     NewsArticleList,
     NewsArticleResponse,
     NewsArticleUpdate,
@@ -128,27 +130,40 @@ async def delete_news_article(
     return MessageResponse(message=f"News article with ID {article_id} deleted successfully")
 
 
-@router.get("/search/", response_model=NewsArticleList)
+@router.get("/search/", response_model=NewsArticleCursorPage)
 async def search_news_articles(
     db: DBSession,
     q: Annotated[str, Query(min_length=1)] = "",
-    page: Annotated[int, Query(ge=1)] = 1,
+    after_created_at: Annotated[datetime | None, Query()] = None,
+    after_id: Annotated[int | None, Query(ge=1)] = None,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
-) -> NewsArticleList:
+) -> NewsArticleCursorPage:
     """
-    Search news articles by title or content.
+    Search news articles by title or content, newest first.
 
     - **q**: Search query
-    - **page**: Page number (starting from 1)
+    - **after_created_at** / **after_id**: Cursor from the previous page's
+      `next_after_created_at` / `next_after_id` (omit both for the first page)
     - **page_size**: Number of items per page (max 100)
     """
-    skip = (page - 1) * page_size
-    items = await news_article.search(db, query=q, skip=skip, limit=page_size)
-    total = len(items)  # In production, you'd want a separate count query
+    if (after_created_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_created_at and after_id must be provided together",
+        )
 
-    return NewsArticleList(
+    items = await news_article.search(
+        db,
+        query=q,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        limit=page_size,
+    )
+    has_more = len(items) == page_size
+
+    return NewsArticleCursorPage(
         items=[NewsArticleResponse.model_validate(item) for item in items],
-        total=total,
-        page=page,
         page_size=page_size,
+        next_after_created_at=items[-1].created_at if has_more else None,
+        next_after_id=items[-1].id if has_more else None,
     )
@@ -143,5 +143,9 @@ async def get_sentiment_by_article(
 
     - **article_id**: The ID of the news article
     """
-    analyses = await sentiment_analysis.get_by_news_article(db, news_article_id=article_id)
-    return [SentimentAnalysisResponse.model_validate(analysis) for analysis in analyses]
+    return [
+        SentimentAnalysisResponse.model_validate(analysis)
+        async for analysis in sentiment_analysis.iter_by_news_article(
+            db, news_article_id=article_id
+        )
+    ]
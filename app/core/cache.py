@@ -0,0 +1,37 @@
+"""Shared Redis connection for caches that span worker processes."""
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+_client: redis.Redis | None = None
+
+
+def get_redis() -> redis.Redis | None:
+    """
+    Get the shared Redis client, creating it on first use.
+
+    Short socket timeouts keep an unavailable Redis from stalling requests;
+    callers treat Redis as best-effort and fall through on errors.
+
+    Returns:
+        Redis client, or None when Redis caching is disabled
+    """
+    global _client
+    if not settings.REDIS_CACHE_ENABLED:
+        return None
+    if _client is None:
+        _client = redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5,
+        )
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
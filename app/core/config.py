@@ -42,6 +42,17 @@ class Settings(BaseSettings):
     DATABASE_PASSWORD: str = "postgres"
     DATABASE_NAME: str = "ai_service"
     DATABASE_ECHO: bool = False
+    # Per-process connection limits. Raise them for DB-heavy load, keeping
+    # (POOL_SIZE + MAX_OVERFLOW) x workers x replicas below Postgres max_connections
+    DATABASE_POOL_SIZE: int = 10
+    DATABASE_MAX_OVERFLOW: int = 20
+    # Seconds to wait for a free connection before failing the request
+    DATABASE_POOL_TIMEOUT: float = 5.0
+    # Recycle connections older than this many seconds (avoids server/proxy idle cutoffs)
+    DATABASE_POOL_RECYCLE: int = 1800
+    # Create missing tables at startup. Unset means only in development; other
+    # environments rely on Alembic migrations
+    AUTO_CREATE_TABLES: bool | None = None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -58,11 +69,20 @@ class Settings(BaseSettings):
             )
         )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def CREATE_TABLES_ON_STARTUP(self) -> bool:
+        """Whether the app should run create_all at startup."""
+        if self.AUTO_CREATE_TABLES is None:
+            return self.ENVIRONMENT == "development"
+        return self.AUTO_CREATE_TABLES
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_PASSWORD: str | None = None
+    REDIS_CACHE_ENABLED: bool = True
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -90,6 +110,10 @@ class Settings(BaseSettings):
         default="http://localhost:9002",
         description="URL of the crawler/news service"
     )
+    TRUST_CRAWLER_SCHEMA: bool = Field(
+        default=False,
+        description="Build crawler news summaries without pydantic validation (crawler output is trusted)"
+    )
     CHART_SERVICE_URL: str = Field(
         default="http://localhost:3001",
         description="URL of the chart service"
@@ -110,6 +134,41 @@ class Settings(BaseSettings):
         le=2.0,
         description="OpenAI temperature for response consistency"
     )
+    OPENAI_MAX_CONCURRENCY: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum in-flight OpenAI requests per process"
+    )
+    OPENAI_RPM: int = Field(
+        default=500,
+        ge=1,
+        description="OpenAI requests-per-minute budget enforced client-side"
+    )
+    OPENAI_TPM: int = Field(
+        default=200_000,
+        ge=1,
+        description="OpenAI tokens-per-minute budget enforced client-side"
+    )
+    HTML_PARSER_BATCH_WINDOW_MS: int = Field(
+        default=50,
+        ge=0,
+        description="How long concurrent HTML parse requests are collected into one OpenAI call"
+    )
+    HTML_PARSER_MAX_BATCH_SIZE: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum articles per batched HTML parse call (1 disables batching)"
+    )
+    ENABLE_LLM_CASCADE: bool = Field(
+        default=False,
+        description="Try the keyword analyzer first and only call OpenAI when it is unsure"
+    )
+    CASCADE_CONFIDENCE_THRESHOLD: float = Field(
+        default=0.75,
+        ge=0.0,
+        le=1.0,
+        description="Keyword-analyzer confidence at or above which OpenAI is skipped"
+    )
 
     # Logging
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
@@ -0,0 +1,48 @@
+"""Structured logging setup."""
+
+import logging
+import logging.handlers
+import queue
+import sys
+
+import structlog
+
+from app.core.config import settings
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging() -> None:
+    """
+    Configure structlog for the application.
+
+    Calls below LOG_LEVEL return before any event dict is built or processed.
+    Rendered lines go to a stdlib logger whose handler only enqueues them; a
+    listener thread does the actual stdout writes, so request handlers never
+    block on log I/O. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    output = logging.getLogger("ai_service")
+    output.setLevel(settings.LOG_LEVEL)
+    output.addHandler(logging.handlers.QueueHandler(log_queue))
+    output.propagate = False
+    _listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _listener.start()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, settings.LOG_LEVEL)),
+        logger_factory=lambda *args: output,
+        cache_logger_on_first_use=True,
+    )
+
+
+def flush_logging() -> None:
+    """Write out queued log lines and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
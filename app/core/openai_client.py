@@ -0,0 +1,95 @@
+"""Shared OpenAI client so services reuse one connection pool."""
+
+import asyncio
+
+import httpx
+import structlog
+from openai import AsyncOpenAI, AsyncStream
+from openai.types.chat import ChatCompletionChunk
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+_client: AsyncOpenAI | None = None
+_warm_task: asyncio.Task[None] | None = None
+
+
+def get_openai_client() -> AsyncOpenAI | None:
+    """
+    Get the shared OpenAI client, creating it on first use.
+
+    Every service that calls OpenAI with default retry behaviour goes through
+    this client, so they share one keep-alive pool instead of each opening
+    their own.
+
+    Returns:
+        OpenAI client, or None when no API key is configured
+    """
+    global _client
+    if not settings.OPENAI_API_KEY:
+        return None
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=500, max_keepalive_connections=200),
+            ),
+        )
+    return _client
+
+
+async def collect_stream(
+    stream: AsyncStream[ChatCompletionChunk], model: str
+) -> tuple[str, str]:
+    """
+    Accumulate a streamed chat completion.
+
+    Streaming means a cancelled caller (e.g. a disconnected client) aborts the
+    generation mid-way instead of waiting for the full completion.
+
+    Args:
+        stream: Stream returned by chat.completions.create(stream=True)
+        model: Model to report if the stream carries none
+
+    Returns:
+        Tuple of (content, model)
+    """
+    parts: list[str] = []
+    async with stream:
+        async for chunk in stream:
+            model = chunk.model or model
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+    return "".join(parts), model
+
+
+async def _warm() -> None:
+    try:
+        await _client.with_options(timeout=5.0, max_retries=0).models.list()
+    except Exception as e:
+        logger.debug("OpenAI connection warm-up failed", error=str(e))
+
+
+def warm_openai_connection() -> None:
+    """
+    Open a pooled connection to OpenAI in the background.
+
+    Call this before other I/O that precedes a completion: the TCP/TLS
+    handshake then overlaps that I/O instead of delaying the completion.
+    At most one warm-up runs at a time; it is never cancelled, since an
+    interrupted handshake leaves nothing in the pool.
+    """
+    global _warm_task
+    if _client is None or (_warm_task is not None and not _warm_task.done()):
+        return
+    _warm_task = asyncio.create_task(_warm())
+
+
+async def close_openai() -> None:
+    """Close the shared OpenAI client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
@@ -0,0 +1,75 @@
+"""Client-side throttling for OpenAI requests."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """
+    Proactive requests-per-minute and tokens-per-minute limiter.
+
+    Mirrors the capacity tracking in OpenAI's parallel request processor: both
+    budgets refill continuously, and a request is admitted only when it fits in
+    both, so bursts wait locally instead of being rejected with 429s.
+    """
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request of `tokens` estimated tokens fits in the budget."""
+        # A single oversized request can never fit; let it through at full capacity
+        tokens = min(tokens, self.tpm)
+        # Holding the lock while sleeping keeps admission first-come, first-served
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.rpm,
+                    (tokens - self._tokens) * 60 / self.tpm,
+                )
+                await asyncio.sleep(wait)
+
+
+def estimate_tokens(messages: Iterable[dict[str, Any]], max_tokens: int) -> int:
+    """Roughly estimate prompt plus completion tokens (~4 characters per token)."""
+    prompt_chars = sum(len(message.get("content") or "") for message in messages)
+    return prompt_chars // 4 + max_tokens
+
+
+_openai_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+_openai_bucket = TokenBucket(rpm=settings.OPENAI_RPM, tpm=settings.OPENAI_TPM)
+
+
+@asynccontextmanager
+async def openai_slot(est_tokens: int) -> AsyncIterator[None]:
+    """
+    Hold a concurrency slot and rate-limit budget for one OpenAI request.
+
+    Args:
+        est_tokens: Estimated prompt plus completion tokens for the request
+    """
+    async with _openai_semaphore:
+        await _openai_bucket.acquire(est_tokens)
+        yield
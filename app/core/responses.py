@@ -0,0 +1,39 @@
+"""Response classes shared by the application."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        # default=str keeps values json can't encode (e.g. exceptions in
+        # validation error contexts) from failing the error response itself
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class StaticJSONResponse:
+    """
+    Pre-serialized JSON body for endpoints whose response never changes.
+
+    The body and its ETag are built once; requests carrying a matching
+    If-None-Match get an empty 304 instead.
+    """
+
+    def __init__(self, content: Any, cache_control: str = "no-cache") -> None:
+        body = orjson.dumps(content)
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        self._ok = Response(content=body, media_type="application/json", headers=headers)
+        self._not_modified = Response(status_code=304, headers=headers)
+
+    def __call__(self, request: Request) -> Response:
+        """Return the cached response, or 304 if the client already has it."""
+        if request.headers.get("if-none-match") == self.etag:
+            return self._not_modified
+        return self._ok
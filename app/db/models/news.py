@@ -2,7 +2,8 @@
 
 from datetime import datetime
 
-from sqlalchemy import String, Text
+from sqlalchemy import Computed, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base, TimestampMixin
@@ -12,6 +13,15 @@ class NewsArticle(Base, TimestampMixin):
     """Model for storing news articles."""
 
     __tablename__ = "news_articles"
+    __table_args__ = (
+        Index("news_search_gin", "search_vec", postgresql_using="gin"),
+        Index(
+            "idx_news_category_created_at_id",
+            "category",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -21,6 +31,15 @@ class NewsArticle(Base, TimestampMixin):
     author: Mapped[str | None] = mapped_column(String(200), nullable=True)
     published_at: Mapped[datetime | None] = mapped_column(nullable=True)
     category: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Full-text search vector maintained by Postgres; deferred so it's never loaded with rows
+    search_vec: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     def __repr__(self) -> str:
         return f"<NewsArticle(id={self.id}, title='{self.title[:50]}...')>"
@@ -0,0 +1,29 @@
+"""Price prediction model."""
+
+from typing import Any
+
+from sqlalchemy import Float, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base, TimestampMixin
+
+
+class PricePrediction(Base, TimestampMixin):
+    """Model for storing AI price predictions per symbol."""
+
+    __tablename__ = "price_predictions"
+    __table_args__ = (Index("idx_symbol_created_at", "symbol", "created_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    symbol: Mapped[str] = mapped_column(String(20), index=True, nullable=False)
+    prediction: Mapped[str] = mapped_column(String(20), nullable=False)  # e.g., "bullish", "bearish"
+    confidence: Mapped[float] = mapped_column(Float, nullable=False)
+    sentiment_summary: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    reasoning: Mapped[str] = mapped_column(Text, nullable=False)
+    key_factors: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False)
+    news_analyzed: Mapped[int] = mapped_column(Integer, nullable=False)
+    model_version: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PricePrediction(id={self.id}, symbol='{self.symbol}', prediction='{self.prediction}')>"
@@ -1,6 +1,6 @@
 """Sentiment analysis model."""
 
-from sqlalchemy import Float, ForeignKey, String, Text
+from sqlalchemy import Float, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
@@ -10,6 +10,13 @@ class SentimentAnalysis(Base, TimestampMixin):
     """Model for storing sentiment analysis results."""
 
     __tablename__ = "sentiment_analyses"
+    __table_args__ = (
+        Index(
+            "idx_sentiment_news_article_created_at",
+            "news_article_id",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     news_article_id: Mapped[int] = mapped_column(
@@ -35,3 +35,21 @@ class HTMLParseResponse(BaseModel):
     method: str = Field(..., description="Parsing method used ('ai' or 'fallback')")
     error: Optional[str] = Field(None, description="Error message if parsing failed")
     metadata: Optional[dict] = Field(None, description="Additional metadata about the parsing process")
+
+
+class HTMLParseBatchRequest(BaseModel):
+    """Request schema for submitting HTML parsing to the OpenAI Batch API."""
+
+    requests: list[HTMLParseRequest] = Field(
+        ..., min_length=1, max_length=1000, description="HTML documents to parse"
+    )
+
+
+class HTMLParseBatchResponse(BaseModel):
+    """Response schema for a batch HTML parsing job."""
+
+    batch_id: str = Field(..., description="OpenAI batch ID")
+    status: str = Field(..., description="Batch status (validating, in_progress, completed, failed, ...)")
+    results: Optional[list[HTMLParseResponse]] = Field(
+        None, description="Parse results in submission order, once the batch has completed"
+    )
@@ -69,3 +69,17 @@ class NewsArticleList(BaseSchema):
     total: int
     page: int
     page_size: int
+
+
+class NewsArticleCursorPage(BaseSchema):
+    """Schema for a keyset-paginated page of news articles.
+
+    Pass ``next_after_created_at`` and ``next_after_id`` back as
+    ``after_created_at`` / ``after_id`` to fetch the following page; both are
+    null once the last page has been reached.
+    """
+
+    items: list[NewsArticleResponse]
+    page_size: int
+    next_after_created_at: datetime | None = None
+    next_after_id: int | None = None
@@ -11,11 +11,11 @@ class NewsSummary(BaseModel):
     
     id: str
     title: str
-    summary: str
+    summary: str = ""
     source: str
     published_at: datetime
-    sentiment: dict
-    related_pairs: list[str]
+    sentiment: dict = Field(default_factory=dict)
+    related_pairs: list[str] = Field(default_factory=list)
 
 
 class PricePredictionRequest(BaseModel):
@@ -103,7 +103,7 @@ class LongPollingPredictionRequest(BaseModel):
         default=10,
         ge=5,
         le=120,
-        description="Request timeout (5-120 seconds, endpoint returns instantly from DB)"
+        description="Max seconds to wait for a newer prediction when the client already has the latest (5-120)"
     )
 
 
@@ -0,0 +1,104 @@
+"""Completion cache for deterministic OpenAI prompts.
+
+Identical prompts (the same news text, the same set of articles) recur often,
+so completions are cached by a hash of everything that shapes the output: an
+in-process TTL cache first, then Redis so other workers can reuse the result.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
+
+import orjson
+import structlog
+from cachetools import TTLCache
+
+from app.core.cache import get_redis
+
+logger = structlog.get_logger()
+
+_TTL_SECONDS = 3600
+_REDIS_KEY_PREFIX = "llm_completion:"
+
+
+class CachedCompletion(NamedTuple):
+    """Completion text and the model that produced it."""
+
+    content: str
+    model: str
+
+
+_local_cache: TTLCache[str, CachedCompletion] = TTLCache(maxsize=1024, ttl=_TTL_SECONDS)
+
+
+def _is_json(content: str) -> bool:
+    """Default validator: the completion is complete, parseable JSON."""
+    try:
+        orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return False
+    return True
+
+
+def completion_key(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+    """Build a cache key from the model, sampling temperature and rendered prompts."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, str(temperature), system_prompt, user_prompt):
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+async def get_or_call(
+    key: str,
+    call: Callable[[], Awaitable[CachedCompletion]],
+    validate: Callable[[str], bool] = _is_json,
+) -> CachedCompletion:
+    """
+    Return a cached completion for key, or run call and cache its result.
+
+    Redis is best-effort: lookup or store failures, and entries that can't be
+    decoded, fall through to the API. Only completions that pass validate are
+    cached, so e.g. a reply cut off at max_tokens is retried on the next call
+    instead of being served for the whole TTL.
+
+    Args:
+        key: Key from completion_key
+        call: Makes the OpenAI request on a cache miss
+        validate: Decides whether a completion's content is worth caching
+
+    Returns:
+        The cached or freshly generated completion
+    """
+    cached = _local_cache.get(key)
+    if cached is not None:
+        return cached
+
+    client = get_redis()
+    if client is not None:
+        try:
+            payload = await client.get(_REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis completion cache lookup failed", error=str(e))
+            payload = None
+        if payload is not None:
+            try:
+                cached = CachedCompletion(*orjson.loads(payload))
+            except (orjson.JSONDecodeError, TypeError) as e:
+                logger.warning("Ignoring undecodable cached completion", error=str(e))
+                cached = None
+            if cached is not None and validate(cached.content):
+                _local_cache[key] = cached
+                return cached
+
+    completion = await call()
+    if not completion.content or not validate(completion.content):
+        return completion
+
+    _local_cache[key] = completion
+    if client is not None:
+        try:
+            await client.setex(_REDIS_KEY_PREFIX + key, _TTL_SECONDS, orjson.dumps(tuple(completion)))
+        except Exception as e:
+            logger.warning("Redis completion cache store failed", error=str(e))
+    return completion
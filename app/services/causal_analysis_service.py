@@ -9,6 +9,7 @@ import structlog
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.openai_client import get_openai_client
 from app.schemas.causal_analysis import (
     CausalAnalysisRequest,
     CausalAnalysisResult,
@@ -37,7 +38,7 @@ class CausalAnalysisService:
         self.binance_api_base = "https://api.binance.com/api/v3"
         
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = get_openai_client()
             logger.info(
                 "Causal analysis service initialized",
                 model=self.model_version,
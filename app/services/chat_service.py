@@ -3,30 +3,129 @@
 import json
 import re
 import uuid
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 import structlog
+from cachetools import TTLCache
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.openai_client import get_openai_client
 from app.schemas.chat import ChatMessage
 from app.schemas.price_prediction import PricePredictionRequest
 from app.services.price_prediction_service import price_prediction_service
 
 logger = structlog.get_logger()
 
+# Messages kept per conversation; the chat endpoint trims its history to the same length
+_MAX_HISTORY_MESSAGES = 50
+
+# Tool definitions for OpenAI function calling (MCP pattern).
+# Built once at import time and reused by every request instead of being
+# rebuilt per call.
+_AVAILABLE_TOOLS: tuple[dict[str, Any], ...] = (
+    {
+        "type": "function",
+        "function": {
+            "name": "get_crypto_price_prediction",
+            "description": "Dự đoán xu hướng tăng/giảm giá cryptocurrency dựa trên phân tích tin tức mới nhất. Sử dụng tool này khi user hỏi về dự đoán giá, xu hướng, hoặc phân tích coin cụ thể.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "symbol": {
+                        "type": "string",
+                        "description": "Cryptocurrency trading pair symbol (e.g., BTCUSDT, ETHUSDT, SOLUSDT, BNBUSDT, ADAUSDT, DOGEUSDT)",
+                        "enum": [
+                            "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT",
+                            "ADAUSDT", "DOGEUSDT", "XRPUSDT", "DOTUSDT",
+                            "AVAXUSDT", "MATICUSDT"
+                        ]
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Số lượng tin tức để phân tích (mặc định: 10)",
+                        "default": 10,
+                        "minimum": 5,
+                        "maximum": 20
+                    }
+                },
+                "required": ["symbol"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "search_articles_db",
+            "description": "Search the internal database of cryptocurrency news articles. Use this tool to find recent information, emerging patterns, and data for predictive analysis. Essential for answering questions about market trends, news, or when user asks for research.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "keyword": {
+                        "type": "string",
+                        "description": "Search keyword or topic (e.g., 'Bitcoin', 'regulation', 'DeFi', 'Ethereum upgrade')"
+                    },
+                    "symbol": {
+                        "type": "string",
+                        "description": "Optional cryptocurrency symbol to filter results (e.g., 'BTC', 'ETH', 'SOL')"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Number of articles to retrieve (default: 10)",
+                        "default": 10,
+                        "minimum": 5,
+                        "maximum": 30
+                    }
+                },
+                "required": ["keyword"]
+            }
+        }
+    },
+)
+
 
 class ChatService:
     """Service for handling AI chatbox conversations using OpenAI."""
 
     def __init__(self) -> None:
         """Initialize ChatService with OpenAI client."""
+        self.model_version = settings.OPENAI_MODEL
+        # Chat answers rarely need more; a lower cap bounds generation latency
+        self.max_tokens = 400
         self.client: AsyncOpenAI | None = None
+        # Serialized OpenAI messages per conversation, extended turn by turn;
+        # idle conversations expire so the cache cannot grow without bound
+        self._history_cache: TTLCache[str, list[dict[str, Any]]] = TTLCache(
+            maxsize=1024, ttl=3600
+        )
+        # Tool name -> handler, used by _execute_tool
+        self._tool_handlers: dict[
+            str, Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+        ] = {
+            "get_crypto_price_prediction": self._run_price_prediction_tool,
+            "search_articles_db": self._run_search_articles_tool,
+        }
+        # Long-lived crawler client so bursts of article searches share HTTP/2
+        # connections instead of paying a TCP/TLS handshake per tool call
+        self._crawler_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                retries=1,
+            ),
+        )
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-            logger.info("ChatService initialized with OpenAI client")
+            self.client = get_openai_client()
+            logger.info("ChatService initialized with OpenAI client", model=self.model_version)
         else:
             logger.warning("ChatService initialized without OpenAI API key")
 
@@ -82,72 +181,14 @@ class ChatService:
         message_lower = message.lower()
         return any(keyword in message_lower for keyword in prediction_keywords)
     
-    def _get_available_tools(self) -> list[dict[str, Any]]:
+    def _get_available_tools(self) -> tuple[dict[str, Any], ...]:
         """
         Define available tools for OpenAI function calling (MCP pattern).
         
         Returns:
-            List of tool definitions
+            Tuple of tool definitions (shared, do not mutate)
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_crypto_price_prediction",
-                    "description": "Dự đoán xu hướng tăng/giảm giá cryptocurrency dựa trên phân tích tin tức mới nhất. Sử dụng tool này khi user hỏi về dự đoán giá, xu hướng, hoặc phân tích coin cụ thể.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "symbol": {
-                                "type": "string",
-                                "description": "Cryptocurrency trading pair symbol (e.g., BTCUSDT, ETHUSDT, SOLUSDT, BNBUSDT, ADAUSDT, DOGEUSDT)",
-                                "enum": [
-                                    "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT",
-                                    "ADAUSDT", "DOGEUSDT", "XRPUSDT", "DOTUSDT",
-                                    "AVAXUSDT", "MATICUSDT"
-                                ]
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Số lượng tin tức để phân tích (mặc định: 10)",
-                                "default": 10,
-                                "minimum": 5,
-                                "maximum": 20
-                            }
-                        },
-                        "required": ["symbol"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "search_articles_db",
-                    "description": "Search the internal database of cryptocurrency news articles. Use this tool to find recent information, emerging patterns, and data for predictive analysis. Essential for answering questions about market trends, news, or when user asks for research.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "keyword": {
-                                "type": "string",
-                                "description": "Search keyword or topic (e.g., 'Bitcoin', 'regulation', 'DeFi', 'Ethereum upgrade')"
-                            },
-                            "symbol": {
-                                "type": "string",
-                                "description": "Optional cryptocurrency symbol to filter results (e.g., 'BTC', 'ETH', 'SOL')"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Number of articles to retrieve (default: 10)",
-                                "default": 10,
-                                "minimum": 5,
-                                "maximum": 30
-                            }
-                        },
-                        "required": ["keyword"]
-                    }
-                }
-            }
-        ]
+        return _AVAILABLE_TOOLS
     
     async def _execute_tool(self, tool_name: str, tool_args: dict[str, Any]) -> dict[str, Any]:
         """
@@ -160,139 +201,331 @@ class ChatService:
         Returns:
             Tool execution result
         """
-        if tool_name == "get_crypto_price_prediction":
-            try:
-                symbol = tool_args.get("symbol", "BTCUSDT")
-                limit = tool_args.get("limit", 10)
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
+            return {
+                "success": False,
+                "error": f"Unknown tool: {tool_name}"
+            }
+        return await handler(tool_args)
+
+    async def _run_price_prediction_tool(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Execute the `get_crypto_price_prediction` tool."""
+        try:
+            symbol = tool_args.get("symbol", "BTCUSDT")
+            limit = tool_args.get("limit", 10)
+            
+            logger.info(
+                "Executing price prediction tool",
+                symbol=symbol,
+                limit=limit
+            )
+            
+            # Call prediction service
+            request = PricePredictionRequest(symbol=symbol, limit=limit)
+            prediction_result, news_articles = await price_prediction_service.predict_price(request)
+            
+            # Format result for AI (JSON-ready values dumped in one pass)
+            return {
+                "success": True,
+                "symbol": symbol,
+                **prediction_result.model_dump(
+                    mode="json",
+                    include={
+                        "prediction",
+                        "confidence",
+                        "sentiment_summary",
+                        "reasoning",
+                        "key_factors",
+                        "analyzed_at",
+                    },
+                ),
+                "news_analyzed": len(news_articles),
+            }
+        except Exception as e:
+            logger.error(
+                "Tool execution failed",
+                tool_name="get_crypto_price_prediction",
+                error=str(e)
+            )
+            return {
+                "success": False,
+                "error": f"Failed to get prediction: {str(e)}"
+            }
+
+    async def _run_search_articles_tool(self, tool_args: dict[str, Any]) -> dict[str, Any]:
+        """Execute the `search_articles_db` tool."""
+        try:
+            keyword = tool_args.get("keyword", "")
+            symbol = tool_args.get("symbol", "")
+            limit = tool_args.get("limit", 10)
+            
+            logger.info(
+                "Executing search_articles_db tool",
+                keyword=keyword,
+                symbol=symbol,
+                limit=limit
+            )
+            
+            # Build search query
+            search_query = keyword
+            if symbol:
+                search_query = f"{symbol} {keyword}".strip()
+            
+            # Call crawler service API
+            response = await self._crawler_client.get(
+                f"{settings.CRAWLER_SERVICE_URL}/api/news/search",
+                params={
+                    "keyword": search_query,
+                    "limit": limit
+                },
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                articles = data.get("data", {}).get("items", [])
+                
+                if not articles:
+                    return {
+                        "success": True,
+                        "articles_found": 0,
+                        "message": f"No articles found for keyword: {search_query}",
+                        "articles": []
+                    }
+                
+                # Format articles for AI
+                formatted_articles = []
+                for article in articles[:limit]:
+                    formatted_articles.append({
+                        "id": article.get("id"),
+                        "title": article.get("title"),
+                        "summary": article.get("summary", ""),
+                        "source": article.get("source"),
+                        "published_at": article.get("published_at"),
+                        "url": article.get("url", "")
+                    })
                 
                 logger.info(
-                    "Executing price prediction tool",
-                    symbol=symbol,
-                    limit=limit
+                    "Articles retrieved successfully",
+                    count=len(formatted_articles),
+                    keyword=keyword
                 )
                 
-                # Call prediction service
-                request = PricePredictionRequest(symbol=symbol, limit=limit)
-                prediction_result, news_articles = await price_prediction_service.predict_price(request)
-                
-                # Format result for AI
                 return {
                     "success": True,
-                    "symbol": symbol,
-                    "prediction": prediction_result.prediction,
-                    "confidence": prediction_result.confidence,
-                    "sentiment_summary": prediction_result.sentiment_summary,
-                    "reasoning": prediction_result.reasoning,
-                    "key_factors": prediction_result.key_factors,
-                    "news_analyzed": len(news_articles),
-                    "analyzed_at": prediction_result.analyzed_at.isoformat()
+                    "articles_found": len(formatted_articles),
+                    "search_query": search_query,
+                    "articles": formatted_articles
                 }
-            except Exception as e:
+            else:
                 logger.error(
-                    "Tool execution failed",
-                    tool_name=tool_name,
-                    error=str(e)
+                    "Failed to fetch articles from crawler",
+                    status_code=response.status_code
                 )
                 return {
                     "success": False,
-                    "error": f"Failed to get prediction: {str(e)}"
+                    "error": f"Failed to fetch articles: HTTP {response.status_code}"
                 }
-        
-        elif tool_name == "search_articles_db":
-            try:
-                keyword = tool_args.get("keyword", "")
-                symbol = tool_args.get("symbol", "")
-                limit = tool_args.get("limit", 10)
                 
-                logger.info(
-                    "Executing search_articles_db tool",
-                    keyword=keyword,
-                    symbol=symbol,
-                    limit=limit
-                )
-                
-                # Build search query
-                search_query = keyword
-                if symbol:
-                    search_query = f"{symbol} {keyword}".strip()
-                
-                # Call crawler service API
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        f"{settings.CRAWLER_SERVICE_URL}/api/news/search",
-                        params={
-                            "keyword": search_query,
-                            "limit": limit
-                        },
-                        timeout=10.0
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        articles = data.get("data", {}).get("items", [])
-                        
-                        if not articles:
-                            return {
-                                "success": True,
-                                "articles_found": 0,
-                                "message": f"No articles found for keyword: {search_query}",
-                                "articles": []
-                            }
-                        
-                        # Format articles for AI
-                        formatted_articles = []
-                        for article in articles[:limit]:
-                            formatted_articles.append({
-                                "id": article.get("id"),
-                                "title": article.get("title"),
-                                "summary": article.get("summary", ""),
-                                "source": article.get("source"),
-                                "published_at": article.get("published_at"),
-                                "url": article.get("url", "")
-                            })
-                        
-                        logger.info(
-                            "Articles retrieved successfully",
-                            count=len(formatted_articles),
-                            keyword=keyword
-                        )
-                        
-                        return {
-                            "success": True,
-                            "articles_found": len(formatted_articles),
-                            "search_query": search_query,
-                            "articles": formatted_articles
-                        }
-                    else:
-                        logger.error(
-                            "Failed to fetch articles from crawler",
-                            status_code=response.status_code
-                        )
-                        return {
-                            "success": False,
-                            "error": f"Failed to fetch articles: HTTP {response.status_code}"
-                        }
-                        
-            except Exception as e:
-                logger.error(
-                    "Tool execution failed",
-                    tool_name=tool_name,
-                    error=str(e)
-                )
-                return {
-                    "success": False,
-                    "error": f"Failed to search articles: {str(e)}"
-                }
+        except Exception as e:
+            logger.error(
+                "Tool execution failed",
+                tool_name="search_articles_db",
+                error=str(e)
+            )
+            return {
+                "success": False,
+                "error": f"Failed to search articles: {str(e)}"
+            }
+
+    def _format_prediction_response(self, tool_result: dict[str, Any]) -> str:
+        """
+        Render the final answer for a price prediction tool result locally.
+
+        The prediction service already returns a structured prediction, so the
+        response template is filled in here instead of asking OpenAI to
+        transcribe it in a second round-trip.
+
+        Args:
+            tool_result: Successful result of the `get_crypto_price_prediction` tool
+
+        Returns:
+            Formatted assistant response
+        """
+        prediction = str(tool_result.get("prediction", "neutral")).lower()
+        symbol = tool_result.get("symbol", "")
+        confidence = float(tool_result.get("confidence", 0.0))
+
+        if prediction == "bullish":
+            icon, direction = "📈 🚀", "TĂNG GIÁ"
+        elif prediction == "bearish":
+            icon, direction = "📉 🔻", "GIẢM GIÁ"
+        else:
+            icon, direction = "➡️ ⚖️", "ĐI NGANG"
+
+        lines = [
+            f"{icon} **{symbol}: {direction}**",
+            "",
+            f"**Độ tin cậy:** {confidence * 100:.0f}%",
+            "",
+            f"**Phân tích:** {tool_result.get('reasoning', '')}",
+        ]
+
+        key_factors = tool_result.get("key_factors") or []
+        if key_factors:
+            lines.append("")
+            lines.append("**Yếu tố chính:**")
+            lines.extend(f"- {factor}" for factor in key_factors)
+
+        lines.extend([
+            "",
+            f"_Dựa trên {tool_result.get('news_analyzed', 0)} tin tức mới nhất. "
+            "Đây không phải là lời khuyên tài chính._",
+            "",
+            "[SUGGESTIONS]",
+            f"- Tin tức nào đang ảnh hưởng mạnh nhất đến {symbol}?",
+            f"- Xu hướng của {symbol} trong tuần tới sẽ ra sao?",
+            "- Các coin khác đang có xu hướng như thế nào?",
+        ])
+        return "\n".join(lines)
+
+    async def aclose(self) -> None:
+        """Close the crawler HTTP client."""
+        await self._crawler_client.aclose()
+
+    def _get_history_messages(
+        self,
+        conversation_id: str | None,
+        conversation_history: list[ChatMessage] | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get conversation history as OpenAI messages, reusing the cached copy.
+
+        The cache is only trusted while it has as many messages as the history
+        passed in; otherwise (e.g. after the history was trimmed) it is rebuilt.
+
+        Args:
+            conversation_id: Conversation ID used as cache key
+            conversation_history: Previous messages in the conversation
+
+        Returns:
+            Serialized history messages (shared, do not mutate)
+        """
+        history = conversation_history or []
+        if conversation_id:
+            cached = self._history_cache.get(conversation_id)
+            if cached is not None and len(cached) == len(history):
+                return cached
+
+        serialized = [{"role": msg.role, "content": msg.content} for msg in history]
+        if conversation_id:
+            self._history_cache[conversation_id] = serialized
+        return serialized
+
+    def _remember_turn(
+        self, conversation_id: str | None, user_message: str, assistant_content: str
+    ) -> None:
+        """Append a completed user/assistant turn to the cached history."""
+        if not conversation_id:
+            return
+        cached = self._history_cache.get(conversation_id)
+        if cached is not None:
+            cached.append({"role": "user", "content": user_message})
+            cached.append({"role": "assistant", "content": assistant_content})
+            # Trim like the endpoint does so the length check keeps matching
+            del cached[:-_MAX_HISTORY_MESSAGES]
+
+    def forget_conversation(self, conversation_id: str) -> None:
+        """Drop the cached history of a conversation."""
+        self._history_cache.pop(conversation_id, None)
+
+    async def _answer_prediction_request(
+        self, messages: list[dict[str, Any]], symbol: str
+    ) -> str:
+        """
+        Answer a detected prediction request without letting OpenAI pick the tool.
+
+        Args:
+            messages: Conversation messages including the current user message
+            symbol: Trading pair symbol extracted from the user message
+
+        Returns:
+            Final assistant response content
+        """
+        function_args = {"symbol": symbol, "limit": 10}
+        logger.info(
+            "Prediction intent detected, invoking tool directly",
+            function="get_crypto_price_prediction",
+            args=function_args,
+        )
+        tool_result = await self._execute_tool("get_crypto_price_prediction", function_args)
+
+        if tool_result.get("success"):
+            assistant_content = self._format_prediction_response(tool_result)
+            logger.info(
+                "Chat response generated from prediction tool without OpenAI",
+                response_length=len(assistant_content),
+            )
+            return assistant_content
+
+        # Let the model explain the failure from a synthetic tool call/result pair
+        tool_call_id = f"call_{uuid.uuid4().hex[:24]}"
+        messages.append({
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": tool_call_id,
+                "type": "function",
+                "function": {
+                    "name": "get_crypto_price_prediction",
+                    "arguments": json.dumps(function_args),
+                },
+            }],
+        })
+        messages.append({
+            "role": "tool",
+            "tool_call_id": tool_call_id,
+            "name": "get_crypto_price_prediction",
+            "content": orjson.dumps(tool_result).decode()
+        })
+        return await self._synthesize_with_tool_results(messages)
+
+    async def _synthesize_with_tool_results(self, messages: list[Any]) -> str:
+        """
+        Call OpenAI with tool results appended to get the final response.
+
+        Args:
+            messages: Conversation messages ending with tool results
+
+        Returns:
+            Final assistant response content
+        """
+        logger.info("Calling OpenAI with tool results")
+        second_response = await self.client.chat.completions.create(
+            model=self.model_version,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=self.max_tokens,
+            top_p=1,
+            frequency_penalty=0,
+            presence_penalty=0,
+        )
         
-        return {
-            "success": False,
-            "error": f"Unknown tool: {tool_name}"
-        }
+        # Extract final assistant's response
+        assistant_content = second_response.choices[0].message.content or "I'm sorry, I couldn't generate a response."
+        
+        logger.info(
+            "Chat response generated with tool execution",
+            response_length=len(assistant_content),
+            tokens_used=second_response.usage.total_tokens if second_response.usage else 0,
+        )
+        return assistant_content
 
     async def chat(
         self,
         user_message: str,
         conversation_history: list[ChatMessage] | None = None,
+        conversation_id: str | None = None,
     ) -> ChatMessage:
         """
         Send a chat message and get AI response with function calling (MCP pattern).
@@ -301,6 +534,7 @@ class ChatService:
         Args:
             user_message: User's message
             conversation_history: Previous messages in the conversation
+            conversation_id: Conversation ID for reusing the serialized history
 
         Returns:
             ChatMessage: AI assistant's response
@@ -401,108 +635,106 @@ class ChatService:
             "- Be helpful in explaining complex concepts when asked"
         )
         
-        # Build conversation context
+        # Build conversation context: system prompt, cached history, current message
         messages: list[dict[str, Any]] = [
             {
                 "role": "system",
                 "content": system_prompt,
-            }
+            },
+            *self._get_history_messages(conversation_id, conversation_history),
+            {"role": "user", "content": user_message},
         ]
 
-        # Add conversation history
-        if conversation_history:
-            for msg in conversation_history:
-                messages.append({"role": msg.role, "content": msg.content})
-
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
-
         try:
-            logger.info(
-                "Sending chat request to OpenAI with function calling",
-                message_count=len(messages),
-                user_message_length=len(user_message),
-            )
-
-            # Get available tools
-            tools = self._get_available_tools()
-            
-            # Call OpenAI API with function calling enabled
-            response = await self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-                tools=tools,
-                tool_choice="auto",  # Let AI decide when to use tools
-                temperature=0.7,
-                max_tokens=800,  # Increased for detailed prediction responses
-                top_p=1,
-                frequency_penalty=0,
-                presence_penalty=0,
-            )
-            
-            response_message = response.choices[0].message
-            
-            # Check if AI wants to call a function
-            if response_message.tool_calls:
+            # Obvious prediction requests are detected locally, so the tool is
+            # invoked directly instead of spending a round-trip on tool selection
+            symbol = self._extract_crypto_symbol(user_message)
+            if symbol and self._is_prediction_request(user_message):
+                assistant_content = await self._answer_prediction_request(messages, symbol)
+            else:
                 logger.info(
-                    "AI requested tool execution",
-                    tool_count=len(response_message.tool_calls)
+                    "Sending chat request to OpenAI with function calling",
+                    message_count=len(messages),
+                    user_message_length=len(user_message),
                 )
-                
-                # Add AI's response to messages
-                messages.append(response_message)
-                
-                # Execute all tool calls
-                for tool_call in response_message.tool_calls:
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-                    
-                    logger.info(
-                        "Executing tool",
-                        function=function_name,
-                        args=function_args
-                    )
-                    
-                    # Execute the tool
-                    tool_result = await self._execute_tool(function_name, function_args)
-                    
-                    # Add tool result to messages
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "name": function_name,
-                        "content": json.dumps(tool_result)
-                    })
-                
-                # Call OpenAI again with tool results
-                logger.info("Calling OpenAI with tool results")
-                second_response = await self.client.chat.completions.create(
-                    model="gpt-3.5-turbo",
+
+                # Get available tools
+                tools = self._get_available_tools()
+            
+                # Call OpenAI API with function calling enabled
+                response = await self.client.chat.completions.create(
+                    model=self.model_version,
                     messages=messages,
+                    tools=tools,
+                    tool_choice="auto",  # Let AI decide when to use tools
                     temperature=0.7,
-                    max_tokens=800,
+                    max_tokens=self.max_tokens,
                     top_p=1,
                     frequency_penalty=0,
                     presence_penalty=0,
                 )
+            
+                response_message = response.choices[0].message
+            
+                # Check if AI wants to call a function
+                if response_message.tool_calls:
+                    logger.info(
+                        "AI requested tool execution",
+                        tool_count=len(response_message.tool_calls)
+                    )
                 
-                # Extract final assistant's response
-                assistant_content = second_response.choices[0].message.content or "I'm sorry, I couldn't generate a response."
+                    # Add AI's response to messages
+                    messages.append(response_message)
                 
-                logger.info(
-                    "Chat response generated with tool execution",
-                    response_length=len(assistant_content),
-                    tokens_used=second_response.usage.total_tokens if second_response.usage else 0,
-                )
-            else:
-                # No tool call, direct response
-                assistant_content = response_message.content or "I'm sorry, I couldn't generate a response."
+                    # Execute all tool calls
+                    tool_result: dict[str, Any] = {}
+                    for tool_call in response_message.tool_calls:
+                        function_name = tool_call.function.name
+                        function_args = json.loads(tool_call.function.arguments)
+                    
+                        logger.info(
+                            "Executing tool",
+                            function=function_name,
+                            args=function_args
+                        )
+                    
+                        # Execute the tool
+                        tool_result = await self._execute_tool(function_name, function_args)
+                    
+                        # Add tool result to messages
+                        messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call.id,
+                            "name": function_name,
+                            "content": orjson.dumps(tool_result).decode()
+                        })
                 
-                logger.info(
-                    "Chat response generated without tools",
-                    response_length=len(assistant_content),
-                    tokens_used=response.usage.total_tokens if response.usage else 0,
-                )
+                    # A lone prediction tool call carries everything the answer needs,
+                    # so render it locally and skip the second OpenAI round-trip
+                    if (
+                        len(response_message.tool_calls) == 1
+                        and response_message.tool_calls[0].function.name == "get_crypto_price_prediction"
+                        and tool_result.get("success")
+                    ):
+                        assistant_content = self._format_prediction_response(tool_result)
+                    
+                        logger.info(
+                            "Chat response generated from prediction tool without synthesis",
+                            response_length=len(assistant_content),
+                            tokens_used=response.usage.total_tokens if response.usage else 0,
+                        )
+                    else:
+                        # Call OpenAI again with tool results
+                        assistant_content = await self._synthesize_with_tool_results(messages)
+                else:
+                    # No tool call, direct response
+                    assistant_content = response_message.content or "I'm sorry, I couldn't generate a response."
+                
+                    logger.info(
+                        "Chat response generated without tools",
+                        response_length=len(assistant_content),
+                        tokens_used=response.usage.total_tokens if response.usage else 0,
+                    )
 
             # Create response message
             assistant_message = ChatMessage(
@@ -511,16 +743,19 @@ class ChatService:
                 content=assistant_content,
                 timestamp=datetime.utcnow(),
             )
+            self._remember_turn(conversation_id, user_message, assistant_content)
 
             return assistant_message
 
         except Exception as e:
             logger.error("Error in chat service", error=str(e), exc_info=True)
             # Return a friendly error message to the user
+            error_content = "I'm sorry, I'm having trouble processing your request right now. Please try again later."
+            self._remember_turn(conversation_id, user_message, error_content)
             return ChatMessage(
                 id=f"assistant-{uuid.uuid4().hex[:12]}",
                 role="assistant",
-                content="I'm sorry, I'm having trouble processing your request right now. Please try again later.",
+                content=error_content,
                 timestamp=datetime.utcnow(),
             )
 
@@ -1,18 +1,201 @@
 """AI-based HTML content parser using OpenAI."""
 
-import json
+import asyncio
+import hashlib
 import re
+import string
+from collections.abc import Iterator
 from html import unescape
 from typing import Any
 
+import httpx
+import openai
+import orjson
 import structlog
+from cachetools import TTLCache
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 
+from app.core.cache import get_redis
 from app.core.config import settings
+from app.core.rate_limit import estimate_tokens, openai_slot
 from app.schemas.html_parser import HTMLParseRequest, HTMLParseResponse, ParsedArticle
 
 logger = structlog.get_logger()
 
+# Successful parse results keyed by a digest of the raw HTML; feeds re-poll the
+# same pages often, and a hit skips both cleaning and the OpenAI round-trip
+_PARSE_CACHE: TTLCache[str, HTMLParseResponse] = TTLCache(maxsize=1024, ttl=3600)
+
+# Second tier shared across workers through Redis, keyed by article URL
+_REDIS_KEY_PREFIX = "html_parse:"
+_REDIS_TTL_SECONDS = 3600
+
+# ASCII-only lowercasing table for the rare documents whose length str.lower() changes
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Start of a non-content block stripped by _clean_html (matched on lowered HTML)
+_CLEAN_START_RE = re.compile(r"<(script|style|noscript)\b|<!--")
+
+# Opening tags of content containers (matched on lowered HTML); the matching
+# closing tag is located with str.find, which mirrors a non-greedy `.*?` without
+# the regex engine re-scanning the document for every candidate
+_HEAD_OPEN_RE = re.compile(r"<head\b[^>]*>")
+_CONTENT_PRIORITIES: tuple[tuple[re.Pattern[str], str, str], ...] = (
+    (re.compile(r"<article\b[^>]*>"), "</article", "article"),
+    (re.compile(r"<main\b[^>]*>"), "</main", "main"),
+    (re.compile(r'<div\b[^>]*class=["\'][^"\']*article[^"\']*["\'][^>]*>'), "</div", "article-div"),
+    (re.compile(r'<div\b[^>]*class=["\'][^"\']*content[^"\']*["\'][^>]*>'), "</div", "content-div"),
+    (re.compile(r"<body\b[^>]*>"), "</body", "body"),
+)
+
+# <meta property|name="..." content="..."> pairs, indexed once per document
+_META_RE = re.compile(
+    r'<meta\s+(?:property|name)=["\']([^"\']+)["\']\s+content=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.IGNORECASE | re.DOTALL)
+_ARTICLE_OPEN_RE = re.compile(r"<article\b[^>]*>")
+_MAIN_OPEN_RE = re.compile(r"<main\b[^>]*>")
+
+# Field patterns used by the fallback extractors
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TITLE_SUFFIX_RE = re.compile(r"\s*[-|]\s*.*$")
+_H1_RE = re.compile(r"<h1[^>]*>(.*?)</h1>", re.IGNORECASE | re.DOTALL)
+_AUTHOR_RES: tuple[re.Pattern[str], ...] = (
+    re.compile(r'<[^>]+class=["\'][^"\']*author[^"\']*["\'][^>]*>(.*?)</[^>]+>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<span[^>]*itemprop=["\']author["\'][^>]*>(.*?)</span>', re.IGNORECASE | re.DOTALL),
+)
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>', re.IGNORECASE)
+# Cleaned HTML size above which fallback extraction runs off the event loop
+_FALLBACK_THREAD_THRESHOLD = 100_000
+
+# Image URL substrings that mark a likely article image, or an icon/logo to skip
+_IMAGE_KEYWORDS = ("article", "post", "featured", "hero", "main", "cover", "thumbnail")
+_IMAGE_SKIP_KEYWORDS = ("icon", "logo", "avatar", "favicon")
+_TIME_DATETIME_RE = re.compile(r'<time[^>]+datetime=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Extraction instructions shared by single and batched requests
+_SYSTEM_PROMPT = """You are an expert web content extractor specializing in news articles. Extract COMPLETE structured article data from HTML.
+
+CRITICAL REQUIREMENTS:
+- title: Main article title (required, must extract accurately)
+- content: COMPLETE FULL article text body (REQUIRED - extract ALL paragraphs, ALL sentences, ALL content)
+  * DO NOT truncate or summarize the content
+  * Extract EVERY paragraph from the article body
+  * Include all text content, preserve paragraph structure
+  * Minimum 500+ characters expected for full articles
+  * Remove only navigation, ads, comments, footer - keep ALL article text
+
+OPTIONAL FIELDS (extract if available):
+- summary: Brief summary/excerpt (first paragraph or meta description)
+- author: Author name
+- published_at: Publication date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
+- image_url: Main article image URL (PRIORITY: og:image > article:image > featured image > first large image)
+- tags: List of tags/categories
+- language: Language code (en, th, zh, etc.)
+
+EXTRACTION RULES:
+1. CONTENT IS CRITICAL: Extract the COMPLETE article body text - every paragraph, every sentence
+2. For content: Look for <article>, <main>, or content containers - extract ALL text inside
+3. Clean content: Remove HTML tags but preserve paragraph breaks (use \\n\\n between paragraphs)
+4. Normalize whitespace: Multiple spaces to single space, but keep line breaks for paragraphs
+5. For image_url: Check meta og:image first, then article/featured images, then first large image
+6. Use null (not empty string) if optional field not found
+7. Be adaptive: Handle different HTML structures, focus on semantic content extraction
+8. If content seems incomplete, try to find more content in the HTML
+
+Return ONLY valid JSON:
+{
+  "title": "string (full title)",
+  "content": "string (COMPLETE full article text - all paragraphs, minimum 500+ chars)",
+  "summary": "string or null",
+  "author": "string or null",
+  "published_at": "string or null",
+  "image_url": "string or null",
+  "tags": ["string"],
+  "language": "string or null"
+}"""
+
+# Appended to the system prompt when several articles share one request
+_BATCH_SYSTEM_PROMPT = _SYSTEM_PROMPT + """
+
+BATCH MODE: The user message contains several articles, each starting with a line
+"=== ARTICLE idx=N ===". Extract every article independently using the schema above and
+return ONLY valid JSON of the form:
+{
+  "results": [
+    {"idx": 0, "title": "...", "content": "...", ...},
+    {"idx": 1, "title": "...", "content": "...", ...}
+  ]
+}
+Include exactly one object per article, tagged with its integer idx."""
+
+# Attempts per AI parse for rate-limit/timeout/connection errors before degrading
+# to the regex fallback
+_MAX_AI_ATTEMPTS = 3
+# Longest wait between attempts; a server asking for more degrades to the fallback at once
+_MAX_RETRY_DELAY_SECONDS = 10.0
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read the server-suggested delay from a rate-limit error's headers, if any."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = response.headers.get(header)
+        if value:
+            try:
+                return float(value) * scale
+            except ValueError:
+                continue
+    return None
+
+
+# (result_data, model, tokens_used) for one extracted article
+_Extraction = tuple[dict[str, Any], str, int]
+
+
+def _index_meta_tags(html: str) -> dict[str, str]:
+    """Map lowercased meta property/name to its content; the first occurrence wins."""
+    meta: dict[str, str] = {}
+    for match in _META_RE.finditer(html):
+        meta.setdefault(match.group(1).lower(), match.group(2))
+    return meta
+
+
+def _lower_for_search(html: str) -> str:
+    """
+    Lowercase HTML for case-insensitive tag search, keeping every index valid.
+
+    str.lower() runs in C and is far faster than str.translate(), which falls
+    back to a per-character path once a page contains any non-ASCII text. It
+    only shifts indexes when a character lowercases to several (e.g. U+0130),
+    which the length check catches.
+    """
+    lower = html.lower()
+    return lower if len(lower) == len(html) else html.translate(_ASCII_LOWER)
+
+
+def _iter_element_contents(
+    html: str, lower: str, open_re: re.Pattern[str], closing: str
+) -> Iterator[str]:
+    """Yield the inner HTML of each element, pairing an opening tag with the next closing tag."""
+    pos = 0
+    while True:
+        match = open_re.search(lower, pos)
+        if match is None:
+            return
+        close_at = lower.find(closing, match.end())
+        if close_at == -1:
+            # No closing tag after this one means none after later ones either
+            return
+        yield html[match.end():close_at]
+        pos = close_at + len(closing)
+
 
 class HTMLParserService:
     """Service for parsing HTML content using AI to extract structured article data."""
@@ -24,10 +207,28 @@ class HTMLParserService:
         self.max_tokens = min(settings.OPENAI_MAX_TOKENS * 10, 2000)
         self.temperature = settings.OPENAI_TEMPERATURE
         self.client: AsyncOpenAI | None = None
+        # Micro-batcher: concurrent AI parses are coalesced into one request
+        self._batch_queue: asyncio.Queue[tuple[str, asyncio.Future[_Extraction | None]]] = asyncio.Queue()
+        self._batch_worker: asyncio.Task[None] | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+        # Pooled transport sized for bursts of concurrent parses; retries are
+        # handled in _parse_with_ai, so neither the transport nor the SDK retries
+        self._http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=0,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            ),
+        )
 
         # Initialize OpenAI client if API key is available
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self._http_client,
+                max_retries=0,
+            )
             logger.info(
                 "HTML Parser service initialized with OpenAI",
                 model=self.model_version,
@@ -36,6 +237,23 @@ class HTMLParserService:
         else:
             logger.warning("OpenAI API key not found. HTML parser will use fallback method.")
 
+    async def aclose(self) -> None:
+        """Stop the micro-batcher, fail parses still queued, and close the OpenAI HTTP client."""
+        tasks = list(self._batch_tasks)
+        if self._batch_worker is not None:
+            tasks.append(self._batch_worker)
+            self._batch_worker = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        while not self._batch_queue.empty():
+            _, future = self._batch_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("HTML parser service is shutting down"))
+
+        await self._http_client.aclose()
+
     async def parse_html(self, request: HTMLParseRequest) -> HTMLParseResponse:
         """
         Parse HTML content to extract structured article data using AI.
@@ -56,69 +274,148 @@ class HTMLParserService:
         Returns:
             HTMLParseResponse with parsed article data and confidence score
         """
+        cache_key = hashlib.blake2b(
+            request.html_content.encode(), digest_size=16
+        ).hexdigest()
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("HTML parse cache hit", cache_key=cache_key, method=cached.method)
+            return cached
+
+        if request.url:
+            cached = await self._get_shared_cached(request.url)
+            if cached is not None:
+                _PARSE_CACHE[cache_key] = cached
+                return cached
+
         # Clean HTML content (remove scripts, styles, etc.)
         cleaned_html = self._clean_html(request.html_content)
 
         # Use AI if available, otherwise fall back to basic extraction
         if self.client and settings.OPENAI_API_KEY:
-            return await self._parse_with_ai(cleaned_html, request)
+            response = await self._parse_with_ai(cleaned_html, request)
         else:
             logger.info("Using fallback HTML parsing method")
-            return await self._parse_with_fallback(cleaned_html, request)
+            response = await self._parse_with_fallback(cleaned_html, request)
+
+        if response.success:
+            _PARSE_CACHE[cache_key] = response
+            if request.url:
+                await self._set_shared_cached(request.url, response)
+        return response
+
+    async def _get_shared_cached(self, url: str) -> HTMLParseResponse | None:
+        """Look up a parse result cached in Redis by another worker."""
+        client = get_redis()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(_REDIS_KEY_PREFIX + url)
+        except Exception as e:
+            logger.warning("Redis HTML parse cache lookup failed", error=str(e))
+            return None
+        if payload is None:
+            return None
+        try:
+            cached = HTMLParseResponse.model_validate_json(payload)
+        except ValidationError as e:
+            # Corrupt or written under an older schema: drop it and parse afresh
+            logger.warning("Ignoring invalid cached HTML parse result", url=url, error=str(e))
+            try:
+                await client.delete(_REDIS_KEY_PREFIX + url)
+            except Exception as delete_error:
+                logger.warning("Redis HTML parse cache delete failed", error=str(delete_error))
+            return None
+        logger.debug("HTML parse Redis cache hit", url=url)
+        return cached
+
+    async def _set_shared_cached(self, url: str, response: HTMLParseResponse) -> None:
+        """Share a successful parse result with other workers through Redis."""
+        client = get_redis()
+        if client is None:
+            return
+        try:
+            await client.setex(
+                _REDIS_KEY_PREFIX + url, _REDIS_TTL_SECONDS, response.model_dump_json()
+            )
+        except Exception as e:
+            logger.warning("Redis HTML parse cache store failed", error=str(e))
 
     async def _parse_with_ai(
         self, cleaned_html: str, request: HTMLParseRequest
     ) -> HTMLParseResponse:
         """Parse HTML using OpenAI GPT models."""
         try:
-            # Increased HTML preview to 12000 chars to ensure full content extraction
-            # Prioritize main content area but keep meta tags for context
-            html_preview = self._extract_relevant_html(cleaned_html, 12000)
-            if len(cleaned_html) > 12000:
-                html_preview += "\n\n[... HTML content truncated - focus on main article content above ...]"
+            user_prompt = self._build_user_prompt(cleaned_html, request)
 
-            system_prompt = """You are an expert web content extractor specializing in news articles. Extract COMPLETE structured article data from HTML.
+            logger.info(
+                "Calling OpenAI for HTML parsing",
+                model=self.model_version,
+                html_length=len(cleaned_html),
+                url=request.url,
+            )
 
-CRITICAL REQUIREMENTS:
-- title: Main article title (required, must extract accurately)
-- content: COMPLETE FULL article text body (REQUIRED - extract ALL paragraphs, ALL sentences, ALL content)
-  * DO NOT truncate or summarize the content
-  * Extract EVERY paragraph from the article body
-  * Include all text content, preserve paragraph structure
-  * Minimum 500+ characters expected for full articles
-  * Remove only navigation, ads, comments, footer - keep ALL article text
+            for attempt in range(_MAX_AI_ATTEMPTS):
+                try:
+                    result_data, model, tokens_used = await self._request_extraction(user_prompt)
+                    break
+                except _RETRYABLE_ERRORS as e:
+                    delay = _retry_after_seconds(e) or 2 ** attempt
+                    if attempt == _MAX_AI_ATTEMPTS - 1 or delay > _MAX_RETRY_DELAY_SECONDS:
+                        raise
+                    logger.warning(
+                        "OpenAI HTML parsing request failed, retrying",
+                        error_type=type(e).__name__,
+                        attempt=attempt + 1,
+                        retry_in=delay,
+                    )
+                    await asyncio.sleep(delay)
 
-OPTIONAL FIELDS (extract if available):
-- summary: Brief summary/excerpt (first paragraph or meta description)
-- author: Author name
-- published_at: Publication date (ISO format: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-- image_url: Main article image URL (PRIORITY: og:image > article:image > featured image > first large image)
-- tags: List of tags/categories
-- language: Language code (en, th, zh, etc.)
+            response = self._build_ai_response(
+                result_data,
+                {
+                    "model": model,
+                    "tokens_used": tokens_used,
+                    "html_length": len(cleaned_html),
+                },
+            )
+            if response is None:
+                return await self._parse_with_fallback(cleaned_html, request)
+            return response
 
-EXTRACTION RULES:
-1. CONTENT IS CRITICAL: Extract the COMPLETE article body text - every paragraph, every sentence
-2. For content: Look for <article>, <main>, or content containers - extract ALL text inside
-3. Clean content: Remove HTML tags but preserve paragraph breaks (use \\n\\n between paragraphs)
-4. Normalize whitespace: Multiple spaces to single space, but keep line breaks for paragraphs
-5. For image_url: Check meta og:image first, then article/featured images, then first large image
-6. Use null (not empty string) if optional field not found
-7. Be adaptive: Handle different HTML structures, focus on semantic content extraction
-8. If content seems incomplete, try to find more content in the HTML
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse OpenAI response as JSON", error=str(e))
+            return await self._parse_with_fallback(cleaned_html, request)
 
-Return ONLY valid JSON:
-{
-  "title": "string (full title)",
-  "content": "string (COMPLETE full article text - all paragraphs, minimum 500+ chars)",
-  "summary": "string or null",
-  "author": "string or null",
-  "published_at": "string or null",
-  "image_url": "string or null",
-  "tags": ["string"],
-  "language": "string or null"
-}"""
+        except _RETRYABLE_ERRORS as e:
+            logger.error(
+                "OpenAI unavailable for HTML parsing after retries",
+                error=str(e),
+                error_type=type(e).__name__,
+                attempts=_MAX_AI_ATTEMPTS,
+            )
+            return await self._parse_with_fallback(cleaned_html, request)
+
+        except Exception as e:
+            logger.error(
+                "AI HTML parsing failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return await self._parse_with_fallback(cleaned_html, request)
 
-            user_prompt = f"""Extract COMPLETE article data from HTML. CRITICAL: Extract FULL article content (all paragraphs, all text).
+    def _build_user_prompt(self, cleaned_html: str, request: HTMLParseRequest) -> str:
+        """Build the extraction prompt for one article."""
+        # Increased HTML preview to 12000 chars to ensure full content extraction
+        # Prioritize main content area but keep meta tags for context
+        # Pages that already fit are sent whole, skipping the extraction scans
+        if len(cleaned_html) > 12000:
+            html_preview = self._extract_relevant_html(cleaned_html, 12000)
+            html_preview += "\n\n[... HTML content truncated - focus on main article content above ...]"
+        else:
+            html_preview = cleaned_html
+
+        return f"""Extract COMPLETE article data from HTML. CRITICAL: Extract FULL article content (all paragraphs, all text).
 
 URL: {request.url or 'Unknown'}
 Source: {request.source_name or 'Unknown'}
@@ -132,116 +429,370 @@ IMPORTANT:
 - Focus on <article>, <main>, or main content containers
 - Extract title, FULL content, image_url (prioritize og:image), and all metadata."""
 
-            logger.info(
-                "Calling OpenAI for HTML parsing",
-                model=self.model_version,
-                html_length=len(cleaned_html),
-                url=request.url,
-            )
+    def _build_ai_response(
+        self, result_data: dict[str, Any], metadata: dict[str, Any]
+    ) -> HTMLParseResponse | None:
+        """
+        Validate extracted fields and build the AI parse response.
+
+        Args:
+            result_data: JSON object returned by the model
+            metadata: Request metadata (model, tokens, ...) reported with the result
+
+        Returns:
+            HTMLParseResponse, or None if required fields are missing
+        """
+        # Validate and extract fields; the model sends null for missing optional fields
+        title = (result_data.get("title") or "").strip()
+        article_content = (result_data.get("content") or "").strip()
+        summary = (result_data.get("summary") or "").strip() or None
+        author = (result_data.get("author") or "").strip() or None
+        published_at = (result_data.get("published_at") or "").strip() or None
+        image_url = (result_data.get("image_url") or "").strip() or None
+        tags = result_data.get("tags", [])
+        if not isinstance(tags, list):
+            tags = []
+        language = (result_data.get("language") or "").strip() or None
+
+        # Validate required fields
+        if not title or not article_content:
+            logger.warning("AI parsing failed: missing required fields", title=bool(title), content=bool(article_content))
+            return None
+        
+        # Validate content length - warn if too short (might be incomplete)
+        if len(article_content) < 200:
+            logger.warning("AI parsed content is very short (%d chars), might be incomplete", len(article_content))
+        elif len(article_content) < 500:
+            logger.info("AI parsed content is short (%d chars), might be a brief article", len(article_content))
+
+        # Calculate confidence based on content quality
+        confidence = self._calculate_confidence(title, article_content, result_data)
+
+        article = ParsedArticle(
+            title=title,
+            content=article_content,
+            summary=summary,
+            author=author,
+            published_at=published_at,
+            image_url=image_url,
+            tags=tags,
+            language=language,
+        )
+
+        metadata = {**metadata, "content_length": len(article_content)}
+
+        logger.info(
+            "AI HTML parsing completed",
+            title_length=len(title),
+            content_length=len(article_content),
+            confidence=confidence,
+        )
+
+        return HTMLParseResponse(
+            success=True,
+            article=article,
+            confidence=confidence,
+            method="ai",
+            metadata=metadata,
+        )
+
+    async def _request_extraction(self, user_prompt: str) -> _Extraction:
+        """Extract one article, sharing an OpenAI request with concurrent callers when possible."""
+        if settings.HTML_PARSER_MAX_BATCH_SIZE <= 1:
+            return await self._extract_single(user_prompt)
+
+        if self._batch_worker is None or self._batch_worker.done():
+            self._batch_worker = asyncio.create_task(self._run_batch_worker())
+
+        future: asyncio.Future[_Extraction | None] = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((user_prompt, future))
+        result = await future
+        if result is None:
+            # The batched reply was unusable for this article; retry it on its own
+            return await self._extract_single(user_prompt)
+        return result
+
+    async def _run_batch_worker(self) -> None:
+        """Collect queued prompts for up to the batch window and dispatch them together."""
+        loop = asyncio.get_running_loop()
+        window = settings.HTML_PARSER_BATCH_WINDOW_MS / 1000
+        max_size = settings.HTML_PARSER_MAX_BATCH_SIZE
+
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + window
+            while len(batch) < max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
 
-            response = await self.client.chat.completions.create(
+            # Dispatch in the background so the next window opens immediately
+            task = asyncio.create_task(self._dispatch_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_batch(
+        self, batch: list[tuple[str, asyncio.Future[_Extraction | None]]]
+    ) -> None:
+        """Run one (possibly batched) extraction and resolve each waiting caller."""
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            if len(prompts) == 1:
+                results: list[_Extraction | None] = [await self._extract_single(prompts[0])]
+            else:
+                results = await self._extract_batch(prompts)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _extract_single(self, user_prompt: str) -> _Extraction:
+        """Extract one article with its own OpenAI request."""
+        messages = [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+        content, model, tokens_used = await self._stream_completion(messages, self.max_tokens)
+        if not content:
+            raise ValueError("Empty response from OpenAI")
+
+        return orjson.loads(content), model, tokens_used
+
+    async def _extract_batch(self, prompts: list[str]) -> list[_Extraction | None]:
+        """
+        Extract several articles with a single OpenAI request.
+
+        The system prompt is sent once for the whole batch. Articles missing from
+        the reply (or a reply that is not valid JSON) come back as None so their
+        callers can retry individually.
+        """
+        batch_prompt = "\n\n".join(
+            f"=== ARTICLE idx={idx} ===\n{prompt}" for idx, prompt in enumerate(prompts)
+        )
+        logger.info("Calling OpenAI for batched HTML parsing", batch_size=len(prompts))
+
+        messages = [
+            {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": batch_prompt},
+        ]
+        content, model, total_tokens = await self._stream_completion(
+            messages, self.max_tokens * len(prompts)
+        )
+        try:
+            items = orjson.loads(content)["results"] if content else []
+        except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning("Batched HTML parse returned malformed JSON", error=str(e))
+            items = []
+
+        by_idx: dict[int, dict[str, Any]] = {}
+        for item in items if isinstance(items, list) else []:
+            if isinstance(item, dict) and isinstance(item.get("idx"), int):
+                by_idx.setdefault(item["idx"], item)
+
+        # Attribute usage evenly; the shared system prompt is what batching saves
+        tokens_used = total_tokens // len(prompts)
+        return [
+            (by_idx[idx], model, tokens_used) if idx in by_idx else None
+            for idx in range(len(prompts))
+        ]
+
+    async def _stream_completion(
+        self, messages: list[dict[str, str]], max_tokens: int
+    ) -> tuple[str, str, int]:
+        """
+        Run a JSON-mode chat completion as a stream and collect its output.
+
+        Streaming lets a cancelled parse (e.g. a disconnected client) abort the
+        generation mid-way instead of waiting for the full completion.
+
+        Returns:
+            Tuple of (content, model, total tokens used)
+        """
+        chunks: list[str] = []
+        model = self.model_version
+        tokens_used = 0
+        async with openai_slot(estimate_tokens(messages, max_tokens)):
+            stream = await self.client.chat.completions.create(
                 model=self.model_version,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=messages,
                 temperature=self.temperature,
-                max_tokens=self.max_tokens,
+                max_tokens=max_tokens,
                 response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True},
             )
+            async with stream:
+                async for chunk in stream:
+                    model = chunk.model
+                    if chunk.usage:
+                        tokens_used = chunk.usage.total_tokens
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
 
-            content = response.choices[0].message.content
-            if not content:
-                raise ValueError("Empty response from OpenAI")
-
-            result_data = json.loads(content)
-
-            # Validate and extract fields
-            title = result_data.get("title", "").strip()
-            article_content = result_data.get("content", "").strip()
-            summary = result_data.get("summary", "").strip() or None
-            author = result_data.get("author", "").strip() or None
-            published_at = result_data.get("published_at", "").strip() or None
-            image_url = result_data.get("image_url", "").strip() or None
-            tags = result_data.get("tags", [])
-            if not isinstance(tags, list):
-                tags = []
-            language = result_data.get("language", "").strip() or None
-
-            # Validate required fields
-            if not title or not article_content:
-                logger.warning("AI parsing failed: missing required fields", title=bool(title), content=bool(article_content))
-                return await self._parse_with_fallback(cleaned_html, request)
-            
-            # Validate content length - warn if too short (might be incomplete)
-            if len(article_content) < 200:
-                logger.warning("AI parsed content is very short (%d chars), might be incomplete", len(article_content))
-            elif len(article_content) < 500:
-                logger.info("AI parsed content is short (%d chars), might be a brief article", len(article_content))
+        return "".join(chunks), model, tokens_used
 
-            # Calculate confidence based on content quality
-            confidence = self._calculate_confidence(title, article_content, result_data)
+    async def submit_batch(self, requests: list[HTMLParseRequest]) -> str:
+        """
+        Queue HTML parse requests on the OpenAI Batch API.
 
-            article = ParsedArticle(
-                title=title,
-                content=article_content,
-                summary=summary,
-                author=author,
-                published_at=published_at,
-                image_url=image_url,
-                tags=tags,
-                language=language,
-            )
+        Batch jobs cost half as much as synchronous calls and draw on a separate
+        rate-limit pool, so they suit background crawls that can wait for results.
 
-            metadata = {
-                "model": response.model,
-                "tokens_used": response.usage.total_tokens if response.usage else 0,
-                "html_length": len(cleaned_html),
-                "content_length": len(article_content),
-            }
+        Args:
+            requests: HTML parse requests; results are returned in the same order
 
-            logger.info(
-                "AI HTML parsing completed",
-                title_length=len(title),
-                content_length=len(article_content),
-                confidence=confidence,
-            )
+        Returns:
+            OpenAI batch ID to pass to get_batch_results
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI API key not configured; batch parsing is unavailable")
 
-            return HTMLParseResponse(
-                success=True,
-                article=article,
-                confidence=confidence,
+        # Cleaning every document is CPU-bound, so build the input file off the event loop
+        batch_input = await asyncio.to_thread(self._build_batch_input, requests)
+
+        # Batch management calls are not covered by _parse_with_ai's retry loop
+        client = self.client.with_options(max_retries=2)
+        input_file = await client.files.create(
+            file=("html_parse_batch.jsonl", batch_input),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"service": "html_parser"},
+        )
+
+        logger.info("Submitted HTML parse batch", batch_id=batch.id, request_count=len(requests))
+        return batch.id
+
+    def _build_batch_input(self, requests: list[HTMLParseRequest]) -> bytes:
+        """Build the Batch API JSONL input file, one chat completion per request."""
+        lines = []
+        for idx, request in enumerate(requests):
+            cleaned_html = self._clean_html(request.html_content)
+            lines.append(orjson.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_version,
+                    "messages": [
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_user_prompt(cleaned_html, request)},
+                    ],
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+        return b"\n".join(lines)
+
+    async def get_batch_results(
+        self, batch_id: str
+    ) -> tuple[str, list[HTMLParseResponse] | None]:
+        """
+        Fetch the status of a batch and, once completed, its parse results.
+
+        Args:
+            batch_id: ID returned by submit_batch
+
+        Returns:
+            Tuple of (batch status, results in submission order or None if not completed)
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI API key not configured; batch parsing is unavailable")
+
+        client = self.client.with_options(max_retries=2)
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return batch.status, None
+
+        request_count = batch.request_counts.total if batch.request_counts else 0
+        results = [
+            HTMLParseResponse(
+                success=False,
+                confidence=0.0,
                 method="ai",
-                metadata=metadata,
+                error="No result returned for this request",
+                metadata={"batch_id": batch_id},
             )
+            for _ in range(request_count)
+        ]
+        if not batch.output_file_id:
+            return batch.status, results
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse OpenAI response as JSON", error=str(e))
-            return await self._parse_with_fallback(cleaned_html, request)
+        output = await client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            idx = int(record["custom_id"])
+            if not 0 <= idx < request_count:
+                continue
 
-        except Exception as e:
-            logger.error(
-                "AI HTML parsing failed",
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            return await self._parse_with_fallback(cleaned_html, request)
+            response = record.get("response") or {}
+            body = response.get("body") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                error = (record.get("error") or body.get("error") or {}).get("message")
+                results[idx] = results[idx].model_copy(update={"error": error or "Batch request failed"})
+                continue
+
+            try:
+                result_data = orjson.loads(body["choices"][0]["message"]["content"])
+            except (KeyError, IndexError, TypeError, orjson.JSONDecodeError) as e:
+                results[idx] = results[idx].model_copy(update={"error": f"Invalid model output: {e}"})
+                continue
+
+            usage = body.get("usage") or {}
+            try:
+                parsed = self._build_ai_response(
+                    result_data,
+                    {
+                        "model": body.get("model"),
+                        "tokens_used": usage.get("total_tokens", 0),
+                        "batch_id": batch_id,
+                    },
+                )
+            except Exception as e:
+                # One malformed record must not fail the whole batch on every poll
+                logger.warning("Invalid batch parse result", batch_id=batch_id, idx=idx, error=str(e))
+                results[idx] = results[idx].model_copy(update={"error": f"Invalid model output: {e}"})
+                continue
+            if parsed is not None:
+                results[idx] = parsed
+            else:
+                results[idx] = results[idx].model_copy(
+                    update={"error": "Could not extract required fields (title and content)"}
+                )
+
+        return batch.status, results
 
     async def _parse_with_fallback(
         self, cleaned_html: str, request: HTMLParseRequest
     ) -> HTMLParseResponse:
         """Fallback HTML parsing using basic regex and heuristics."""
         try:
-            # Extract title (try multiple patterns)
-            title = self._extract_title_fallback(cleaned_html)
-            
-            # Extract content (try to find main article text)
-            content = self._extract_content_fallback(cleaned_html)
-            
-            # Extract other fields with basic patterns
-            author = self._extract_author_fallback(cleaned_html)
-            image_url = self._extract_image_fallback(cleaned_html)
-            published_at = self._extract_date_fallback(cleaned_html)
+            # Large pages are scanned in a worker thread so the event loop keeps
+            # serving other requests meanwhile
+            if len(cleaned_html) > _FALLBACK_THREAD_THRESHOLD:
+                fields = await asyncio.to_thread(self._extract_fallback_fields, cleaned_html)
+            else:
+                fields = self._extract_fallback_fields(cleaned_html)
+            title, content, author, image_url, published_at = fields
             
             # Basic summary (first 200 chars of content)
             summary = content[:200] + "..." if len(content) > 200 else content
@@ -287,43 +838,62 @@ IMPORTANT:
             )
 
     def _clean_html(self, html: str) -> str:
-        """Remove scripts, styles, and other non-content elements."""
-        # Remove script tags
-        html = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        # Remove style tags
-        html = re.sub(r"<style[^>]*>.*?</style>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        # Remove comments
-        html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
-        # Remove noscript tags
-        html = re.sub(r"<noscript[^>]*>.*?</noscript>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        return html
+        """Remove scripts, styles, comments, and noscript blocks.
+
+        Block ends are located with str.find, so the cost stays linear even for
+        unterminated blocks that make `.*?` regexes backtrack.
+        """
+        lower = _lower_for_search(html)
+        parts: list[str] = []
+        pos = search_from = 0
+        unterminated: set[str] = set()
+        while True:
+            match = _CLEAN_START_RE.search(lower, search_from)
+            if match is None:
+                break
+            tag = match.group(1)
+            closing = f"</{tag}" if tag else "-->"
+            end = -1 if closing in unterminated else lower.find(closing, match.end())
+            if end == -1:
+                # Leave unterminated blocks in place, as the regexes did
+                unterminated.add(closing)
+                search_from = match.end()
+                continue
+            if tag:
+                end = lower.find(">", end)
+                end = len(html) if end == -1 else end + 1
+            else:
+                end += len(closing)
+            parts.append(html[pos:match.start()])
+            pos = search_from = end
+        parts.append(html[pos:])
+        return "".join(parts)
 
     def _extract_relevant_html(self, html: str, max_length: int) -> str:
         """Extract relevant HTML parts: head (meta tags) and main content area.
         Prioritizes main content to ensure full article extraction."""
+        if len(html) <= max_length:
+            return html
+
+        lower = _lower_for_search(html)
+
         # Extract head section (for meta tags, especially og:image) - limit to 2000 chars
-        head_match = re.search(r"<head[^>]*>(.*?)</head>", html, re.IGNORECASE | re.DOTALL)
-        head_content = head_match.group(1)[:2000] if head_match else ""
+        head_content = next(_iter_element_contents(html, lower, _HEAD_OPEN_RE, "</head"), "")[:2000]
         
         # Extract main content areas - prioritize article/main tags
         content_areas = []
-        content_priorities = [
-            (r"<article[^>]*>(.*?)</article>", "article"),
-            (r"<main[^>]*>(.*?)</main>", "main"),
-            (r'<div[^>]*class=["\'][^"\']*article[^"\']*["\'][^>]*>(.*?)</div>', "article-div"),
-            (r'<div[^>]*class=["\'][^"\']*content[^"\']*["\'][^>]*>(.*?)</div>', "content-div"),
-            (r"<body[^>]*>(.*?)</body>", "body"),
-        ]
-        
-        for pattern, name in content_priorities:
-            matches = re.finditer(pattern, html, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                content = match.group(1)
+        for open_re, closing, name in _CONTENT_PRIORITIES:
+            # A substantial article/main hit makes the generic div/body scans unnecessary
+            if content_areas and name not in ("article", "main"):
+                break
+            matched = 0
+            for content in _iter_element_contents(html, lower, open_re, closing):
                 # Filter out very short matches (likely not main content)
                 if len(content.strip()) > 200:
                     content_areas.append((content, name))
+                    matched += 1
                     # Take first 2 matches of each type
-                    if len([c for c in content_areas if c[1] == name]) >= 2:
+                    if matched >= 2:
                         break
         
         # Sort by priority and length (longer content first)
@@ -354,27 +924,46 @@ IMPORTANT:
         
         return relevant
 
-    def _extract_title_fallback(self, html: str) -> str:
+    def _extract_fallback_fields(
+        self, cleaned_html: str
+    ) -> tuple[str, str, str | None, str | None, str | None]:
+        """Extract (title, content, author, image_url, published_at) with the fallback heuristics."""
+        # Scan meta tags once and share them across the field extractors
+        meta = _index_meta_tags(cleaned_html)
+
+        # Extract title (try multiple patterns)
+        title = self._extract_title_fallback(cleaned_html, meta)
+        
+        # Extract content (try to find main article text)
+        content = self._extract_content_fallback(cleaned_html)
+        
+        # Extract other fields with basic patterns
+        author = self._extract_author_fallback(cleaned_html, meta)
+        image_url = self._extract_image_fallback(cleaned_html, meta)
+        published_at = self._extract_date_fallback(cleaned_html, meta)
+        return title, content, author, image_url, published_at
+
+    def _extract_title_fallback(self, html: str, meta: dict[str, str]) -> str:
         """Extract title using fallback methods."""
         # Try meta tags first
-        og_title = re.search(r'<meta\s+property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
+        og_title = meta.get("og:title")
         if og_title:
-            return unescape(og_title.group(1)).strip()
+            return unescape(og_title).strip()
         
         # Try title tag
-        title_match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
+        title_match = _TITLE_RE.search(html)
         if title_match:
-            title = re.sub(r"<[^>]+>", "", title_match.group(1))
+            title = _TAG_RE.sub("", title_match.group(1))
             title = unescape(title).strip()
             # Remove common suffixes
-            title = re.sub(r"\s*[-|]\s*.*$", "", title)
+            title = _TITLE_SUFFIX_RE.sub("", title)
             if len(title) > 10:
                 return title
         
         # Try h1 tag
-        h1_match = re.search(r"<h1[^>]*>(.*?)</h1>", html, re.IGNORECASE | re.DOTALL)
+        h1_match = _H1_RE.search(html)
         if h1_match:
-            title = re.sub(r"<[^>]+>", "", h1_match.group(1))
+            title = _TAG_RE.sub("", h1_match.group(1))
             title = unescape(title).strip()
             if len(title) > 10 and len(title) < 200:
                 return title
@@ -383,114 +972,78 @@ IMPORTANT:
 
     def _extract_content_fallback(self, html: str) -> str:
         """Extract main content using fallback methods."""
-        # Try article tag
-        article_match = re.search(r"<article[^>]*>(.*?)</article>", html, re.IGNORECASE | re.DOTALL)
-        if article_match:
-            content = article_match.group(1)
-            # Extract text from paragraphs
-            paragraphs = re.findall(r"<p[^>]*>(.*?)</p>", content, re.IGNORECASE | re.DOTALL)
-            if paragraphs:
-                text_content = "\n\n".join([
-                    unescape(re.sub(r"<[^>]+>", "", p)).strip()
-                    for p in paragraphs
-                    if len(re.sub(r"<[^>]+>", "", p).strip()) > 50
-                ])
-                if len(text_content) > 200:
-                    return text_content
-        
-        # Try main tag
-        main_match = re.search(r"<main[^>]*>(.*?)</main>", html, re.IGNORECASE | re.DOTALL)
-        if main_match:
-            content = main_match.group(1)
-            paragraphs = re.findall(r"<p[^>]*>(.*?)</p>", content, re.IGNORECASE | re.DOTALL)
-            if paragraphs:
-                text_content = "\n\n".join([
-                    unescape(re.sub(r"<[^>]+>", "", p)).strip()
-                    for p in paragraphs
-                    if len(re.sub(r"<[^>]+>", "", p).strip()) > 50
-                ])
-                if len(text_content) > 200:
-                    return text_content
+        lower = _lower_for_search(html)
+
+        # Try article tag, then main tag
+        for open_re, closing in ((_ARTICLE_OPEN_RE, "</article"), (_MAIN_OPEN_RE, "</main")):
+            content = next(_iter_element_contents(html, lower, open_re, closing), None)
+            if content is None:
+                continue
+            # Extract text from paragraphs, stripping tags once per paragraph and
+            # unescaping entities once for the joined text (none span the separators)
+            stripped = (_TAG_RE.sub("", p).strip() for p in _PARAGRAPH_RE.findall(content))
+            text_content = unescape("\n\n".join(p for p in stripped if len(p) > 50))
+            if len(text_content) > 200:
+                return text_content
         
         return ""
 
-    def _extract_author_fallback(self, html: str) -> str | None:
+    def _extract_author_fallback(self, html: str, meta: dict[str, str]) -> str | None:
         """Extract author using fallback methods."""
         # Try meta tags
-        author_meta = re.search(r'<meta\s+name=["\']author["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
+        author_meta = meta.get("author")
         if author_meta:
-            return unescape(author_meta.group(1)).strip()
+            return unescape(author_meta).strip()
         
         # Try common class patterns
-        author_patterns = [
-            r'<[^>]+class=["\'][^"\']*author[^"\']*["\'][^>]*>(.*?)</[^>]+>',
-            r'<span[^>]*itemprop=["\']author["\'][^>]*>(.*?)</span>',
-        ]
-        for pattern in author_patterns:
-            match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
+        for pattern in _AUTHOR_RES:
+            match = pattern.search(html)
             if match:
-                author = re.sub(r"<[^>]+>", "", match.group(1)).strip()
+                author = _TAG_RE.sub("", match.group(1)).strip()
                 if author and len(author) < 100:
                     return unescape(author)
         
         return None
 
-    def _extract_image_fallback(self, html: str) -> str | None:
+    def _extract_image_fallback(self, html: str, meta: dict[str, str]) -> str | None:
         """Extract main image URL using fallback methods with priority order."""
-        # Priority 1: Open Graph image (most reliable)
-        og_image = re.search(r'<meta\s+property=["\']og:image["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-        if og_image:
-            img_url = og_image.group(1).strip()
+        # Priority 1-3: Open Graph, Twitter card, then article image meta tags
+        for key in ("og:image", "twitter:image", "article:image"):
+            img_url = meta.get(key, "").strip()
             if img_url and not img_url.startswith('data:'):  # Skip data URIs
                 return img_url
         
-        # Priority 2: Twitter card image
-        twitter_image = re.search(r'<meta\s+name=["\']twitter:image["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-        if twitter_image:
-            img_url = twitter_image.group(1).strip()
-            if img_url and not img_url.startswith('data:'):
-                return img_url
-        
-        # Priority 3: Article image meta tag
-        article_image = re.search(r'<meta\s+property=["\']article:image["\']\s+content=["\']([^"\']+)["\']', html, re.IGNORECASE)
-        if article_image:
-            img_url = article_image.group(1).strip()
-            if img_url and not img_url.startswith('data:'):
-                return img_url
-        
         # Priority 4: Images in article/main content with keywords
-        img_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
-        images = re.findall(img_pattern, html, re.IGNORECASE)
+        # Lowercase each candidate once for both passes, skipping data URIs up front
+        images = [
+            (img_url, img_url.lower())
+            for img_url in _IMG_SRC_RE.findall(html)
+            if not img_url.startswith('data:')
+        ]
         
         # Look for images with relevant keywords in URL or attributes
-        for img_url in images:
-            img_url_lower = img_url.lower()
-            if any(keyword in img_url_lower for keyword in ['article', 'post', 'featured', 'hero', 'main', 'cover', 'thumbnail']):
-                if not img_url.startswith('data:') and len(img_url) > 10:
-                    return img_url.strip()
+        for img_url, img_url_lower in images:
+            if len(img_url) > 10 and any(keyword in img_url_lower for keyword in _IMAGE_KEYWORDS):
+                return img_url.strip()
         
         # Priority 5: First large image (not icon/logo)
-        for img_url in images:
-            if not img_url.startswith('data:'):
-                # Skip small images (likely icons/logos)
-                if not any(skip in img_url.lower() for skip in ['icon', 'logo', 'avatar', 'favicon']):
-                    if len(img_url) > 20:  # Reasonable URL length
-                        return img_url.strip()
+        for img_url, img_url_lower in images:
+            # Skip small images (likely icons/logos)
+            if len(img_url) > 20 and not any(skip in img_url_lower for skip in _IMAGE_SKIP_KEYWORDS):  # Reasonable URL length
+                return img_url.strip()
         
         return None
 
-    def _extract_date_fallback(self, html: str) -> str | None:
+    def _extract_date_fallback(self, html: str, meta: dict[str, str]) -> str | None:
         """Extract published date using fallback methods."""
         # Try meta tags
-        date_patterns = [
-            r'<meta\s+property=["\']article:published_time["\']\s+content=["\']([^"\']+)["\']',
-            r'<meta\s+name=["\']publish-date["\']\s+content=["\']([^"\']+)["\']',
-            r'<time[^>]+datetime=["\']([^"\']+)["\']',
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        for key in ("article:published_time", "publish-date"):
+            if key in meta:
+                return meta[key].strip()
+
+        match = _TIME_DATETIME_RE.search(html)
+        if match:
+            return match.group(1).strip()
         
         return None
 
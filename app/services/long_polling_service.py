@@ -1,11 +1,19 @@
 """Service for long-polling price predictions."""
 
 import asyncio
+import random
+import sys
+import time
+import zlib
 from datetime import datetime, timezone
 
 import structlog
+from cachetools import TTLCache
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.price_prediction import PricePrediction
+from app.db.session import async_session_maker
 from app.schemas.price_prediction import (
     LongPollingPredictionRequest,
     LongPollingPredictionResponse,
@@ -14,15 +22,59 @@ from app.schemas.price_prediction import (
 from app.services.price_prediction_crud import price_prediction_crud
 from app.services.price_prediction_service import price_prediction_service
 
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
 logger = structlog.get_logger()
 
 # Cache refresh interval - minimum time between new predictions (to save OpenAI tokens)
 CACHE_REFRESH_INTERVAL_SECONDS = 300  # 5 minutes
 
+# Latest prediction per symbol with its monotonic fetch time, so polls skip the DB
+# round-trip. Entries older than the fresh window are served stale while one
+# background read revalidates them; staleness of the prediction itself is still
+# judged by created_at, so these windows only bound how long a prediction
+# generated by another worker can go unseen
+CACHE_FRESH_SECONDS = 30
+_prediction_cache: TTLCache[str, tuple[float, PricePrediction]] = TTLCache(maxsize=256, ttl=60)
+_revalidating: set[str] = set()
+_background_tasks: set[asyncio.Task[None]] = set()
+
+# In-flight generations per symbol, shared by concurrent pollers (single-flight)
+_inflight: dict[str, asyncio.Task[PricePrediction]] = {}
+
+# Consecutive generation failures per symbol, for client retry backoff
+_failure_counts: dict[str, int] = {}
+FAILURE_BACKOFF_BASE_SECONDS = 10
+
+
+def _jittered_poll_after(seconds: float) -> int:
+    """Spread clients' next polls by +/-20% so they don't all return at the cache boundary."""
+    return max(5, int(seconds * random.uniform(0.8, 1.2)))
+
+
+def _failure_poll_after(symbol: str) -> int | None:
+    """Exponential backoff with jitter while a symbol's generations keep failing."""
+    failures = _failure_counts.get(symbol, 0)
+    if not failures:
+        return None
+    return int(FAILURE_BACKOFF_BASE_SECONDS * (2 ** min(failures - 1, 4)) + random.uniform(0, 5))
+
+
+def _advisory_lock_key(symbol: str) -> int:
+    """Stable per-symbol key for pg advisory locks (hash() is salted per process)."""
+    return zlib.crc32(f"price_prediction:{symbol}".encode()) & 0x7FFFFFFF
+
 
 class LongPollingPredictionService:
     """Service for handling price predictions — database-first with auto-generate."""
 
+    def __init__(self) -> None:
+        """Initialize per-symbol wakeup events for pollers waiting on new data."""
+        self._symbol_events: dict[str, asyncio.Event] = {}
+
     async def poll_for_prediction(
         self,
         db: AsyncSession,
@@ -30,8 +82,10 @@ class LongPollingPredictionService:
     ) -> LongPollingPredictionResponse:
         """
         Return the latest prediction from the database.
-        If no prediction exists or cache is stale, generate a new one via OpenAI,
-        save it to the DB, then return it.
+
+        If no prediction exists or it is stale, a new one is generated via OpenAI
+        in the background. A stale prediction is returned right away; with no
+        prediction at all the request waits for the generation up to its timeout.
         """
         symbol = request.symbol.upper()
         last_prediction_time = request.last_prediction_time
@@ -42,11 +96,12 @@ class LongPollingPredictionService:
             last_prediction_time=last_prediction_time,
         )
 
-        # Fast DB lookup
-        latest_prediction = await price_prediction_crud.get_latest_by_symbol(db, symbol)
+        # In-memory lookup, then fast DB lookup
+        latest_prediction = await self._get_latest(db, symbol)
 
         # Check if we need to generate a new prediction
         need_new_prediction = False
+        time_since_last = 0.0
         if latest_prediction is None:
             need_new_prediction = True
             logger.info("No prediction in DB, will generate", symbol=symbol)
@@ -62,53 +117,79 @@ class LongPollingPredictionService:
                     age_seconds=int(time_since_last),
                 )
 
-        # Generate new prediction if needed
+        # Generate new prediction if needed, without tying it to this request
+        generation: asyncio.Task[PricePrediction] | None = None
         if need_new_prediction:
+            generation = self._start_generation(
+                symbol,
+                request.news_limit if hasattr(request, "news_limit") else 10,
+            )
+
+        if latest_prediction is None:
+            # Nothing to serve yet: wait for the generation without pinning a DB connection
+            await db.close()
             try:
-                predict_request = PricePredictionRequest(
-                    symbol=symbol,
-                    limit=request.news_limit if hasattr(request, "news_limit") else 10,
-                )
-                prediction_result, _news = await price_prediction_service.predict_price(
-                    predict_request
-                )
-                # Save to DB
-                latest_prediction = (
-                    await price_prediction_crud.create_from_prediction_result(
-                        db, prediction_result
-                    )
-                )
-                await db.commit()
-                logger.info(
-                    "New prediction generated and saved",
-                    symbol=symbol,
-                    prediction=prediction_result.prediction,
+                async with async_timeout(request.timeout):
+                    # Shield so one poller timing out does not cancel the shared generation
+                    latest_prediction = await asyncio.shield(generation)
+            except asyncio.TimeoutError:
+                logger.info("Prediction still generating", symbol=symbol)
+                return LongPollingPredictionResponse(
+                    success=True,
+                    has_new_data=False,
+                    prediction=None,
+                    cache_hit=False,
+                    next_poll_after=10,
                 )
             except Exception as e:
-                logger.error(
-                    "Failed to generate prediction, returning cached if available",
-                    symbol=symbol,
-                    error=str(e),
+                logger.error("Failed to generate prediction", symbol=symbol, error=str(e))
+                return LongPollingPredictionResponse(
+                    success=False,
+                    has_new_data=False,
+                    prediction=None,
+                    cache_hit=False,
+                    next_poll_after=_failure_poll_after(symbol) or 10,
                 )
-                # If we have a stale prediction, still return it
-                if latest_prediction is None:
-                    return LongPollingPredictionResponse(
-                        success=False,
-                        has_new_data=False,
-                        prediction=None,
-                        cache_hit=False,
-                        next_poll_after=10,
-                    )
+            # Usually zero, unless another worker's prediction was reused
+            time_since_last = max(
+                0.0,
+                (datetime.now(timezone.utc) - latest_prediction.created_at).total_seconds(),
+            )
+            generation = None
 
         # At this point latest_prediction should exist
         prediction_result = price_prediction_crud.to_prediction_result(latest_prediction)
-        time_since_last = (
-            datetime.now(timezone.utc) - latest_prediction.created_at
-        ).total_seconds()
-        next_poll = max(5, int(CACHE_REFRESH_INTERVAL_SECONDS - time_since_last))
+        # Age was measured once above (or right after generating)
+        next_poll = _jittered_poll_after(CACHE_REFRESH_INTERVAL_SECONDS - time_since_last)
+        retry_after = _failure_poll_after(symbol)
+        if generation is not None and retry_after is not None:
+            # Serving a stale prediction while generations keep failing: back off
+            next_poll = retry_after
 
-        # Client already has this prediction
+        # Client already has this prediction: hold the request until a newer one is
+        # saved, but no longer than it takes the current one to go stale (or, while
+        # one is being regenerated, the request timeout)
         if last_prediction_time and latest_prediction.created_at <= last_prediction_time:
+            # Return the connection to the pool for the idle wait; loaded objects stay usable
+            await db.close()
+            wait_seconds = request.timeout if generation is not None else min(request.timeout, next_poll)
+            new_prediction = await self._wait_for_new_prediction(
+                symbol, last_prediction_time, wait_seconds
+            )
+            if new_prediction is not None:
+                logger.info(
+                    "New prediction arrived while waiting",
+                    symbol=symbol,
+                    prediction=new_prediction.prediction,
+                )
+                return LongPollingPredictionResponse(
+                    success=True,
+                    has_new_data=True,
+                    prediction=price_prediction_crud.to_prediction_result(new_prediction),
+                    cache_hit=False,
+                    next_poll_after=_jittered_poll_after(CACHE_REFRESH_INTERVAL_SECONDS),
+                )
+
             logger.info(
                 "Client already has latest prediction",
                 symbol=symbol,
@@ -128,16 +209,179 @@ class LongPollingPredictionService:
             symbol=symbol,
             prediction=latest_prediction.prediction,
             age_seconds=int(time_since_last),
-            was_generated=need_new_prediction,
+            regenerating=generation is not None,
         )
         return LongPollingPredictionResponse(
             success=True,
             has_new_data=True,
             prediction=prediction_result,
-            cache_hit=not need_new_prediction,
+            cache_hit=generation is None and not need_new_prediction,
             next_poll_after=next_poll,
         )
 
+    def _start_generation(self, symbol: str, news_limit: int) -> asyncio.Task[PricePrediction]:
+        """
+        Start generating a prediction for a symbol in the background.
+
+        Joins a generation already in flight, so concurrent pollers of a stale
+        symbol share one OpenAI call. Waiters are woken via notify_new_prediction
+        once it is saved.
+        """
+        task = _inflight.get(symbol)
+        if task is not None:
+            logger.info("Joining in-flight prediction generation", symbol=symbol)
+            return task
+
+        task = asyncio.create_task(self._generate_prediction(symbol, news_limit))
+        _inflight[symbol] = task
+
+        def _release(done: asyncio.Task[PricePrediction]) -> None:
+            _inflight.pop(symbol, None)
+            if done.cancelled():
+                return
+            # Retrieving the exception also marks it handled if every poller has gone away
+            error = done.exception()
+            if error is None:
+                _failure_counts.pop(symbol, None)
+                self.notify_new_prediction(symbol, done.result())
+            else:
+                _failure_counts[symbol] = _failure_counts.get(symbol, 0) + 1
+                logger.error("Background prediction generation failed", symbol=symbol, error=str(error))
+
+        task.add_done_callback(_release)
+        return task
+
+    def notify_new_prediction(self, symbol: str, prediction: PricePrediction) -> None:
+        """
+        Publish a newly saved prediction to the cache and wake pollers waiting on it.
+
+        Call after the prediction has been committed.
+        """
+        symbol = symbol.upper()
+        _prediction_cache[symbol] = (time.monotonic(), prediction)
+        # Waiters registered after this point get a fresh event
+        event = self._symbol_events.pop(symbol, None)
+        if event is not None:
+            event.set()
+
+    async def _wait_for_new_prediction(
+        self, symbol: str, after_time: datetime, timeout: float
+    ) -> PricePrediction | None:
+        """
+        Wait for a prediction newer than after_time to be saved by this process.
+
+        Waiters are woken by notify_new_prediction rather than re-querying the
+        database on an interval.
+
+        Returns:
+            The new prediction, or None if none arrived within the timeout
+        """
+        event = self._symbol_events.setdefault(symbol, asyncio.Event())
+        # A prediction saved before the event was registered would never wake us
+        newer = self._cached_newer_than(symbol, after_time)
+        if newer is not None:
+            return newer
+        try:
+            async with async_timeout(timeout):
+                await event.wait()
+        except asyncio.TimeoutError:
+            return None
+
+        return self._cached_newer_than(symbol, after_time)
+
+    @staticmethod
+    def _cached_newer_than(symbol: str, after_time: datetime) -> PricePrediction | None:
+        """Return the cached prediction for a symbol if it is newer than after_time."""
+        cached = _prediction_cache.get(symbol)
+        if cached is not None and cached[1].created_at > after_time:
+            return cached[1]
+        return None
+
+    async def _get_latest(self, db: AsyncSession, symbol: str) -> PricePrediction | None:
+        """Get the latest prediction for a symbol, from the cache when possible."""
+        cached = _prediction_cache.get(symbol)
+        if cached is not None:
+            fetched_at, prediction = cached
+            if time.monotonic() - fetched_at > CACHE_FRESH_SECONDS and symbol not in _revalidating:
+                _revalidating.add(symbol)
+                task = asyncio.create_task(self._revalidate(symbol))
+                # Keep a reference so the background refresh is not garbage-collected
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            return prediction
+
+        prediction = await price_prediction_crud.get_latest_by_symbol(db, symbol)
+        if prediction is not None:
+            _prediction_cache[symbol] = (time.monotonic(), prediction)
+        return prediction
+
+    async def _revalidate(self, symbol: str) -> None:
+        """Refresh a cached prediction in the background, waking waiters if a newer one exists."""
+        try:
+            async with async_session_maker() as session:
+                # Probe for anything newer first; only load the full row if there is
+                cached = _prediction_cache.get(symbol)
+                if cached is not None and not await price_prediction_crud.has_newer_than(
+                    session, symbol, cached[1].created_at
+                ):
+                    _prediction_cache[symbol] = (time.monotonic(), cached[1])
+                    return
+                prediction = await price_prediction_crud.get_latest_by_symbol(session, symbol)
+            if prediction is not None:
+                # Typically a prediction saved by another worker
+                self.notify_new_prediction(symbol, prediction)
+        except Exception as e:
+            logger.warning("Failed to revalidate cached prediction", symbol=symbol, error=str(e))
+        finally:
+            _revalidating.discard(symbol)
+
+    async def _generate_prediction(self, symbol: str, news_limit: int) -> PricePrediction:
+        """
+        Generate a prediction via OpenAI and save it in its own session.
+
+        A transaction-scoped advisory lock per symbol keeps workers in other
+        processes from generating the same prediction concurrently; a worker
+        that loses the race returns the latest stored prediction instead.
+        """
+        # The generation can outlive the poller that started it, so it must not
+        # write through that request's session
+        async with async_session_maker() as session:
+            locked = await session.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": _advisory_lock_key(symbol)},
+            )
+            latest_prediction = await price_prediction_crud.get_latest_by_symbol(session, symbol)
+
+            if not locked:
+                logger.info("Prediction is being generated by another worker", symbol=symbol)
+                if latest_prediction is None:
+                    raise RuntimeError(f"Prediction for {symbol} is being generated by another worker")
+                return latest_prediction
+
+            # Another worker may have committed a fresh prediction just before we locked
+            if latest_prediction is not None and (
+                datetime.now(timezone.utc) - latest_prediction.created_at
+            ).total_seconds() <= CACHE_REFRESH_INTERVAL_SECONDS:
+                return latest_prediction
+
+            predict_request = PricePredictionRequest(symbol=symbol, limit=news_limit)
+            prediction_result, _news = await price_prediction_service.predict_price(
+                predict_request
+            )
+
+            prediction = await price_prediction_crud.create_from_prediction_result(
+                session, prediction_result
+            )
+            # Committing also releases the advisory lock
+            await session.commit()
+
+        logger.info(
+            "New prediction generated and saved",
+            symbol=symbol,
+            prediction=prediction_result.prediction,
+        )
+        return prediction
+
 
 # Global instance
 long_polling_service = LongPollingPredictionService()
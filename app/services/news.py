@@ -1,6 +1,8 @@
 """CRUD operations for news articles."""
 
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.news import NewsArticle
@@ -8,6 +10,23 @@ from app.schemas.news import NewsArticleCreate, NewsArticleUpdate
 from app.services.base import CRUDBase
 
 
+def _keyset_page(
+    stmt: Select, after_created_at: datetime | None, after_id: int | None, limit: int
+) -> Select:
+    """Order newest-first and resume strictly after the (created_at, id) cursor."""
+    if after_created_at is not None and after_id is not None:
+        stmt = stmt.where(
+            tuple_(NewsArticle.created_at, NewsArticle.id) < (after_created_at, after_id)
+        )
+    return stmt.order_by(NewsArticle.created_at.desc(), NewsArticle.id.desc()).limit(limit)
+
+
+async def _stream_all(db: AsyncSession, stmt: Select) -> list[NewsArticle]:
+    """Fetch rows through a server-side cursor in chunks rather than one buffered result."""
+    result = await db.stream_scalars(stmt.execution_options(yield_per=50))
+    return [article async for article in result]
+
+
 class CRUDNewsArticle(CRUDBase[NewsArticle, NewsArticleCreate, NewsArticleUpdate]):
     """CRUD operations for news articles."""
 
@@ -17,32 +36,32 @@ class CRUDNewsArticle(CRUDBase[NewsArticle, NewsArticleCreate, NewsArticleUpdate
         return result.scalar_one_or_none()
 
     async def get_by_category(
-        self, db: AsyncSession, *, category: str, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        category: str,
+        after_created_at: datetime | None = None,
+        after_id: int | None = None,
+        limit: int = 100,
     ) -> list[NewsArticle]:
-        """Get news articles by category."""
-        result = await db.execute(
-            select(NewsArticle)
-            .where(NewsArticle.category == category)
-            .offset(skip)
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        """Get news articles by category, newest first, using keyset pagination."""
+        stmt = select(NewsArticle).where(NewsArticle.category == category)
+        return await _stream_all(db, _keyset_page(stmt, after_created_at, after_id, limit))
 
     async def search(
-        self, db: AsyncSession, *, query: str, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        after_created_at: datetime | None = None,
+        after_id: int | None = None,
+        limit: int = 100,
     ) -> list[NewsArticle]:
-        """Search news articles by title or content."""
-        search_pattern = f"%{query}%"
-        result = await db.execute(
-            select(NewsArticle)
-            .where(
-                (NewsArticle.title.ilike(search_pattern))
-                | (NewsArticle.content.ilike(search_pattern))
-            )
-            .offset(skip)
-            .limit(limit)
+        """Search news articles by title or content using the full-text GIN index."""
+        stmt = select(NewsArticle).where(
+            NewsArticle.search_vec.op("@@")(func.plainto_tsquery("english", query))
         )
-        return list(result.scalars().all())
+        return await _stream_all(db, _keyset_page(stmt, after_created_at, after_id, limit))
 
 
 # Singleton instance
@@ -1,13 +1,16 @@
 """Service for generating AI prediction line data for chart overlay."""
 
-import json
+import asyncio
+import time
 from datetime import datetime, timezone
 
 import httpx
+import orjson
 import structlog
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, BadRequestError
 
 from app.core.config import settings
+from app.core.openai_client import get_openai_client
 from app.schemas.price_prediction import (
     PredictionLinePoint,
     PredictionLineRequest,
@@ -28,6 +31,33 @@ INTERVAL_SECONDS: dict[str, int] = {
     "1w": 604800,
 }
 
+# Completion budget per predicted price (digits, decimals and separator)
+_TOKENS_PER_PRICE = 8
+
+
+def _prediction_line_schema(periods: int) -> dict:
+    """Structured-output schema; the API enforces the array length for us."""
+    return {
+        "name": "prediction_line",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "direction": {"type": "string", "enum": ["bullish", "bearish", "neutral"]},
+                "confidence": {"type": "number"},
+                "reasoning": {"type": "string"},
+                "predicted_prices": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": periods,
+                    "maxItems": periods,
+                },
+            },
+            "required": ["direction", "confidence", "reasoning", "predicted_prices"],
+            "additionalProperties": False,
+        },
+    }
+
 
 class PredictionLineService:
     """Generates a predicted price line based on news sentiment + recent price action."""
@@ -36,9 +66,18 @@ class PredictionLineService:
         self.model_version = settings.OPENAI_MODEL
         self.client: AsyncOpenAI | None = None
         self.crawler_base_url = settings.CRAWLER_SERVICE_URL
+        # Long-lived client so Binance and crawler connections (and TLS sessions)
+        # are reused across requests
+        self._http = httpx.AsyncClient(
+            timeout=15.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        # In-flight generations keyed by request parameters (single-flight)
+        self._in_flight: dict[tuple[str, str, int, int], asyncio.Task[PredictionLineResponse]] = {}
 
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = get_openai_client()
             logger.info("PredictionLineService initialized", model=self.model_version)
         else:
             logger.warning("OpenAI API key not found. Prediction line will not be available.")
@@ -47,8 +86,39 @@ class PredictionLineService:
     # Public
     # ------------------------------------------------------------------
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+
     async def generate_prediction_line(
         self, request: PredictionLineRequest
+    ) -> PredictionLineResponse:
+        """Generate a prediction line, sharing the result with identical concurrent requests.
+
+        Clients opening the same chart at once would otherwise each pay for
+        their own OpenAI call.
+        """
+        key = (request.symbol.upper(), request.interval, request.periods, request.news_limit)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate_prediction_line(request))
+            self._in_flight[key] = task
+
+            def _release(done: asyncio.Task[PredictionLineResponse]) -> None:
+                self._in_flight.pop(key, None)
+                # Mark failures as retrieved even if every caller has gone away
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_release)
+        else:
+            logger.info("Joining in-flight prediction line generation", symbol=key[0])
+
+        # Shield so one caller disconnecting does not cancel the shared generation
+        return await asyncio.shield(task)
+
+    async def _generate_prediction_line(
+        self, request: PredictionLineRequest
     ) -> PredictionLineResponse:
         """Generate a prediction line for chart overlay.
 
@@ -67,11 +137,11 @@ class PredictionLineService:
                 f"Supported: {', '.join(INTERVAL_SECONDS.keys())}"
             )
 
-        # Parallel data fetching
-        recent_klines = await self._fetch_recent_klines(
-            request.symbol, request.interval, limit=50
+        # Parallel data fetching (both helpers log and return [] on failure)
+        recent_klines, news_items = await asyncio.gather(
+            self._fetch_recent_klines(request.symbol, request.interval, limit=50),
+            self._fetch_latest_news(request.symbol, request.news_limit),
         )
-        news_items = await self._fetch_latest_news(request.symbol, request.news_limit)
 
         if not recent_klines:
             raise ValueError(f"Could not fetch recent price data for {request.symbol}")
@@ -93,15 +163,16 @@ class PredictionLineService:
             news_context=news_context,
         )
 
-        # Build prediction line points
-        points: list[PredictionLinePoint] = []
-        for i, predicted_price in enumerate(ai_result["predicted_prices"], start=1):
-            points.append(
-                PredictionLinePoint(
-                    time=current_time + i * interval_sec,
-                    value=round(predicted_price, 2),
-                )
-            )
+        # Build prediction line points (range yields the time axis without per-point arithmetic)
+        prices = ai_result["predicted_prices"]
+        times = range(
+            current_time + interval_sec,
+            current_time + (len(prices) + 1) * interval_sec,
+            interval_sec,
+        )
+        points = [
+            PredictionLinePoint(time=t, value=round(p, 2)) for t, p in zip(times, prices)
+        ]
 
         return PredictionLineResponse(
             success=True,
@@ -130,10 +201,9 @@ class PredictionLineService:
             url = "https://api.binance.com/api/v3/klines"
             params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
+            resp = await self._http.get(url, params=params)
+            resp.raise_for_status()
+            data = resp.json()
 
             return [
                 {
@@ -153,15 +223,14 @@ class PredictionLineService:
     async def _fetch_latest_news(self, symbol: str, limit: int) -> list[dict]:
         """Fetch latest news from crawler service."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                url = f"{self.crawler_base_url}/api/v1/news/latest/{symbol}"
-                resp = await client.get(url, params={"limit": limit})
-                resp.raise_for_status()
-                data = resp.json()
-
-                if data.get("success") and "data" in data:
-                    return data["data"].get("items", [])
-                return []
+            url = f"{self.crawler_base_url}/api/v1/news/latest/{symbol}"
+            resp = await self._http.get(url, params={"limit": limit}, timeout=30.0)
+            resp.raise_for_status()
+            data = resp.json()
+
+            if data.get("success") and "data" in data:
+                return data["data"].get("items", [])
+            return []
         except Exception as e:
             logger.warning("Could not fetch news, continuing without", error=str(e))
             return []
@@ -172,13 +241,12 @@ class PredictionLineService:
 
     @staticmethod
     def _format_price_context(klines: list[dict]) -> str:
-        lines = []
-        for k in klines:
-            dt = datetime.fromtimestamp(k["time"], tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
-            lines.append(
-                f"{dt} | O:{k['open']:.2f} H:{k['high']:.2f} L:{k['low']:.2f} C:{k['close']:.2f} V:{k['volume']:.0f}"
-            )
-        return "\n".join(lines)
+        # time.gmtime + time.strftime avoids building a tz-aware datetime per row
+        return "\n".join(
+            f"{time.strftime('%Y-%m-%d %H:%M', time.gmtime(k['time']))} | "
+            f"O:{k['open']:.2f} H:{k['high']:.2f} L:{k['low']:.2f} C:{k['close']:.2f} V:{k['volume']:.0f}"
+            for k in klines
+        )
 
     @staticmethod
     def _format_news_context(news_items: list[dict]) -> str:
@@ -242,39 +310,54 @@ Predict the next {periods} candle close prices."""
             periods=periods,
         )
 
-        response = await self.client.chat.completions.create(
-            model=self.model_version,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=settings.OPENAI_MAX_TOKENS * 4,  # need room for the array
-            temperature=settings.OPENAI_TEMPERATURE,
-            response_format={"type": "json_object"},
-        )
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model_version,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                # Base budget for direction/confidence/reasoning plus room for every price
+                max_tokens=settings.OPENAI_MAX_TOKENS + periods * _TOKENS_PER_PRICE,
+                temperature=settings.OPENAI_TEMPERATURE,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": _prediction_line_schema(periods),
+                },
+                stream=True,
+            )
+            chunks: list[str] = []
+            finish_reason: str | None = None
+            async with stream:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    if choice.delta.content:
+                        chunks.append(choice.delta.content)
+                    finish_reason = choice.finish_reason or finish_reason
+        except BadRequestError as e:
+            logger.error("OpenAI rejected prediction line request", symbol=symbol, error=str(e))
+            raise
+
+        # A reply cut off at max_tokens is incomplete JSON; report it as such
+        if finish_reason == "length":
+            raise ValueError(
+                f"OpenAI prediction line was truncated at max_tokens ({periods} periods)"
+            )
 
-        content = response.choices[0].message.content
+        content = "".join(chunks)
         if not content:
             raise ValueError("Empty response from OpenAI")
 
-        result = json.loads(content)
+        result = orjson.loads(content)
 
-        # Validate
+        # The schema fixes the length, so this only guards against a misbehaving model
         prices = result.get("predicted_prices", [])
-        if not prices or len(prices) < 2:
+        if len(prices) != periods:
             raise ValueError("OpenAI returned insufficient predicted prices")
 
-        # Ensure correct length — pad or trim
-        if len(prices) < periods:
-            last = prices[-1]
-            prices.extend([last] * (periods - len(prices)))
-        elif len(prices) > periods:
-            prices = prices[:periods]
-
         result["predicted_prices"] = [float(p) for p in prices]
-        result.setdefault("direction", "neutral")
-        result.setdefault("confidence", 0.5)
-        result.setdefault("reasoning", "AI prediction based on price action and news sentiment.")
 
         logger.info(
             "Prediction line generated",
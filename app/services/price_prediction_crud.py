@@ -1,9 +1,9 @@
 """CRUD operations for price predictions."""
 
-import json
 from datetime import datetime
 
-from sqlalchemy import desc, select
+from cachetools import LRUCache
+from sqlalchemy import desc, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.price_prediction import PricePrediction
@@ -13,6 +13,11 @@ from app.schemas.price_prediction import PricePredictionResult
 class PricePredictionCRUD:
     """CRUD operations for price predictions."""
 
+    def __init__(self) -> None:
+        # Stored predictions are never updated, so a decoded result can be reused
+        # for every poll that returns the same row
+        self._result_cache: LRUCache[int, PricePredictionResult] = LRUCache(maxsize=512)
+
     async def get_latest_by_symbol(
         self, db: AsyncSession, symbol: str
     ) -> PricePrediction | None:
@@ -34,6 +39,34 @@ class PricePredictionCRUD:
         )
         return result.scalar_one_or_none()
 
+    async def has_newer_than(
+        self, db: AsyncSession, symbol: str, after_time: datetime
+    ) -> bool:
+        """
+        Check whether a prediction newer than after_time exists for a symbol.
+
+        A ``SELECT 1 ... LIMIT 1`` probe on the (symbol, created_at) index, so
+        the usual "nothing new" answer transfers and decodes no row data.
+
+        Args:
+            db: Database session
+            symbol: Trading pair symbol
+            after_time: Reference creation time
+
+        Returns:
+            True if a newer prediction exists
+        """
+        result = await db.execute(
+            select(literal(1))
+            .select_from(PricePrediction)
+            .where(
+                PricePrediction.symbol == symbol.upper(),
+                PricePrediction.created_at > after_time,
+            )
+            .limit(1)
+        )
+        return result.scalar() is not None
+
     async def get_latest_after_time(
         self, db: AsyncSession, symbol: str, after_time: datetime
     ) -> PricePrediction | None:
@@ -76,9 +109,9 @@ class PricePredictionCRUD:
             symbol=result.symbol.upper(),
             prediction=result.prediction,
             confidence=result.confidence,
-            sentiment_summary=json.dumps(result.sentiment_summary),
+            sentiment_summary=result.sentiment_summary,
             reasoning=result.reasoning,
-            key_factors=json.dumps(result.key_factors),
+            key_factors=result.key_factors,
             news_analyzed=result.news_analyzed,
             model_version=result.model_version,
         )
@@ -97,17 +130,23 @@ class PricePredictionCRUD:
         Returns:
             PricePredictionResult schema
         """
-        return PricePredictionResult(
+        cached = self._result_cache.get(prediction.id)
+        if cached is not None:
+            return cached
+
+        result = PricePredictionResult(
             symbol=prediction.symbol,
             prediction=prediction.prediction,
             confidence=prediction.confidence,
-            sentiment_summary=json.loads(prediction.sentiment_summary),
+            sentiment_summary=prediction.sentiment_summary,
             reasoning=prediction.reasoning,
-            key_factors=json.loads(prediction.key_factors),
+            key_factors=prediction.key_factors,
             news_analyzed=prediction.news_analyzed,
             analyzed_at=prediction.created_at,
             model_version=prediction.model_version,
         )
+        self._result_cache[prediction.id] = result
+        return result
 
 
 # Global instance
@@ -1,23 +1,80 @@
 """Service for price prediction based on news sentiment analysis."""
 
-import json
+import time
 from datetime import datetime, timezone
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion
+from pydantic import TypeAdapter
 
 from app.core.config import settings
+from app.core.openai_client import collect_stream, get_openai_client, warm_openai_connection
+from app.core.rate_limit import estimate_tokens, openai_slot
 from app.schemas.price_prediction import (
     NewsSummary,
     PricePredictionRequest,
     PricePredictionResult,
 )
+from app.services._llm_cache import CachedCompletion, completion_key, get_or_call
 
 logger = structlog.get_logger()
 
+_NEWS_SUMMARIES = TypeAdapter(list[NewsSummary])
+
+
+def _construct_news_summary(item: dict[str, Any]) -> NewsSummary:
+    """Build a NewsSummary from a crawler item without running validators."""
+    return NewsSummary.model_construct(
+        id=item["id"],
+        title=item["title"],
+        summary=item.get("summary") or "",
+        source=item["source"],
+        # fromisoformat only accepts the "Z" suffix from Python 3.11
+        published_at=datetime.fromisoformat(item["published_at"].replace("Z", "+00:00")),
+        sentiment=item.get("sentiment") or {},
+        related_pairs=item.get("related_pairs") or [],
+    )
+
+
+# Analyst instructions only: the symbol and news articles are sent in the user
+# message, so every prediction request starts with the same cacheable prefix
+_PRICE_SYSTEM_PROMPT = """You are an expert cryptocurrency market analyst specializing in news-based price prediction.
+
+Analyze the provided news articles about a cryptocurrency trading pair and predict the likely price movement.
+
+Your analysis should consider:
+1. Overall sentiment trend across all articles
+2. Impact level of each news item (market-moving vs routine news)
+3. Recency and timing of news (more recent = higher weight)
+4. Credibility of sources
+5. Correlation between news sentiment and typical market reactions
+6. Any conflicting signals or mixed sentiment
+
+Respond with ONLY valid JSON in this exact format:
+{
+    "prediction": "bullish" | "bearish" | "neutral",
+    "confidence": 0.0 to 1.0,
+    "sentiment_summary": {
+        "overall_sentiment": "positive" | "negative" | "mixed" | "neutral",
+        "bullish_signals": number,
+        "bearish_signals": number,
+        "neutral_signals": number,
+        "sentiment_score": -1.0 to 1.0
+    },
+    "reasoning": "Detailed explanation of your prediction based on the news analysis",
+    "key_factors": ["factor 1", "factor 2", "factor 3"]
+}
+
+Guidelines:
+- "bullish" prediction suggests price increase likely
+- "bearish" prediction suggests price decrease likely  
+- "neutral" suggests no clear direction or balanced signals
+- Confidence should reflect certainty based on signal strength and consistency
+- Key factors should be specific, actionable insights from the news"""
+
 
 class PricePredictionService:
     """Service for predicting price movements based on news sentiment."""
@@ -29,10 +86,18 @@ class PricePredictionService:
         self.temperature = settings.OPENAI_TEMPERATURE
         self.client: AsyncOpenAI | None = None
         self.crawler_base_url = settings.CRAWLER_SERVICE_URL
+        # Long-lived HTTP/2 client so crawler requests are multiplexed over a
+        # kept-alive connection instead of reconnecting on every call
+        self._http = httpx.AsyncClient(
+            base_url=self.crawler_base_url,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        )
         
         # Initialize OpenAI client if API key is available
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = get_openai_client()
             logger.info(
                 "Price prediction service initialized",
                 model=self.model_version,
@@ -43,6 +108,10 @@ class PricePredictionService:
                 "OpenAI API key not found. Price prediction will not be available."
             )
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+
     async def fetch_latest_news(self, symbol: str, limit: int) -> list[dict]:
         """
         Fetch latest news from crawler service.
@@ -54,45 +123,41 @@ class PricePredictionService:
         Returns:
             List of news articles
         """
+        log = logger.bind(symbol=symbol)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                url = f"{self.crawler_base_url}/api/v1/news/latest/{symbol}"
-                params = {"limit": limit}
-                
-                logger.info(
-                    "Fetching latest news from crawler",
-                    symbol=symbol,
-                    limit=limit,
-                    url=url,
+            url = f"/api/v1/news/latest/{symbol}"
+            params = {"limit": limit}
+            
+            log.info(
+                "Fetching latest news from crawler",
+                limit=limit,
+                url=url,
+            )
+            
+            response = await self._http.get(url, params=params)
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            if data.get("success") and "data" in data:
+                items = data["data"].get("items", [])
+                log.info(
+                    "Successfully fetched news from crawler",
+                    count=len(items),
                 )
+                return items
+            else:
+                log.error("Invalid response format from crawler", data=data)
+                return []
                 
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                if data.get("success") and "data" in data:
-                    items = data["data"].get("items", [])
-                    logger.info(
-                        "Successfully fetched news from crawler",
-                        symbol=symbol,
-                        count=len(items),
-                    )
-                    return items
-                else:
-                    logger.error("Invalid response format from crawler", data=data)
-                    return []
-                    
         except httpx.HTTPError as e:
-            logger.error(
+            log.error(
                 "Failed to fetch news from crawler",
-                symbol=symbol,
                 error=str(e),
             )
             raise
         except Exception as e:
-            logger.error(
+            log.error(
                 "Unexpected error fetching news",
-                symbol=symbol,
                 error=str(e),
             )
             raise
@@ -112,27 +177,22 @@ class PricePredictionService:
         if not self.client or not settings.OPENAI_API_KEY:
             raise ValueError("OpenAI API key not configured")
         
+        # Connect to OpenAI while the crawler request is in flight
+        warm_openai_connection()
+
         # Fetch latest news
         news_items = await self.fetch_latest_news(request.symbol, request.limit)
         
         if not news_items:
             raise ValueError(f"No news articles found for symbol {request.symbol}")
         
-        # Convert to NewsSummary objects
-        news_summaries = [
-            NewsSummary(
-                id=item["id"],
-                title=item["title"],
-                summary=item.get("summary", ""),
-                source=item["source"],
-                published_at=datetime.fromisoformat(
-                    item["published_at"].replace("Z", "+00:00")
-                ),
-                sentiment=item.get("sentiment", {}),
-                related_pairs=item.get("related_pairs", []),
-            )
-            for item in news_items
-        ]
+        # Convert to NewsSummary objects in one validation pass (pydantic parses
+        # the ISO timestamps, including the "Z" suffix), or skip validation
+        # entirely when the crawler's output is trusted
+        if settings.TRUST_CRAWLER_SCHEMA:
+            news_summaries = [_construct_news_summary(item) for item in news_items]
+        else:
+            news_summaries = _NEWS_SUMMARIES.validate_python(news_items)
         
         # Prepare news text for analysis
         news_text = self._format_news_for_analysis(news_summaries)
@@ -144,6 +204,7 @@ class PricePredictionService:
 
     def _format_news_for_analysis(self, news: list[NewsSummary]) -> str:
         """Format news articles for OpenAI analysis."""
+        # time.strftime on a timetuple is cheaper than datetime.strftime, same output
         formatted = []
         for i, article in enumerate(news, 1):
             sentiment = article.sentiment
@@ -152,7 +213,7 @@ class PricePredictionService:
                 f"Title: {article.title}\n"
                 f"Summary: {article.summary}\n"
                 f"Source: {article.source}\n"
-                f"Published: {article.published_at.strftime('%Y-%m-%d %H:%M UTC')}\n"
+                f"Published: {time.strftime('%Y-%m-%d %H:%M UTC', article.published_at.timetuple())}\n"
                 f"Current Sentiment: {sentiment.get('label', 'unknown')} "
                 f"(score: {sentiment.get('score', 0):.2f}, "
                 f"confidence: {sentiment.get('confidence', 0):.2f})\n"
@@ -173,75 +234,49 @@ class PricePredictionService:
         Returns:
             Price prediction result
         """
+        log = logger.bind(symbol=symbol, model=self.model_version)
         try:
-            system_prompt = """You are an expert cryptocurrency market analyst specializing in news-based price prediction.
-
-Analyze the provided news articles about a cryptocurrency trading pair and predict the likely price movement.
-
-Your analysis should consider:
-1. Overall sentiment trend across all articles
-2. Impact level of each news item (market-moving vs routine news)
-3. Recency and timing of news (more recent = higher weight)
-4. Credibility of sources
-5. Correlation between news sentiment and typical market reactions
-6. Any conflicting signals or mixed sentiment
-
-Respond with ONLY valid JSON in this exact format:
-{
-    "prediction": "bullish" | "bearish" | "neutral",
-    "confidence": 0.0 to 1.0,
-    "sentiment_summary": {
-        "overall_sentiment": "positive" | "negative" | "mixed" | "neutral",
-        "bullish_signals": number,
-        "bearish_signals": number,
-        "neutral_signals": number,
-        "sentiment_score": -1.0 to 1.0
-    },
-    "reasoning": "Detailed explanation of your prediction based on the news analysis",
-    "key_factors": ["factor 1", "factor 2", "factor 3"]
-}
-
-Guidelines:
-- "bullish" prediction suggests price increase likely
-- "bearish" prediction suggests price decrease likely  
-- "neutral" suggests no clear direction or balanced signals
-- Confidence should reflect certainty based on signal strength and consistency
-- Key factors should be specific, actionable insights from the news"""
-
             user_prompt = f"""Analyze these {news_count} recent news articles for {symbol} and predict the price movement:
 
 {news_text}
 
 Provide your prediction in JSON format."""
 
-            logger.info(
-                "Calling OpenAI for price prediction",
-                symbol=symbol,
-                news_count=news_count,
-                model=self.model_version,
-            )
+            log.info("Calling OpenAI for price prediction", news_count=news_count)
 
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.model_version,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
+            messages = [
+                {"role": "system", "content": _PRICE_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ]
+
+            async def _call() -> CachedCompletion:
+                async with openai_slot(estimate_tokens(messages, self.max_tokens)):
+                    stream = await self.client.chat.completions.create(
+                        model=self.model_version,
+                        messages=messages,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        response_format={"type": "json_object"},
+                        # Routes calls sharing this prefix to the same prompt cache
+                        extra_body={"prompt_cache_key": "price_prediction"},
+                        stream=True,
+                    )
+                    return CachedCompletion(*await collect_stream(stream, self.model_version))
+
+            # The same set of articles reuses an earlier completion instead of calling OpenAI again
+            cache_key = completion_key(
+                self.model_version, self.temperature, _PRICE_SYSTEM_PROMPT, user_prompt
             )
+            content, _model = await get_or_call(cache_key, _call)
 
             # Parse response
-            content = response.choices[0].message.content
             if not content:
                 raise ValueError("Empty response from OpenAI")
 
-            result = json.loads(content)
+            result = orjson.loads(content)
             
-            logger.info(
+            log.info(
                 "Price prediction completed",
-                symbol=symbol,
                 prediction=result.get("prediction"),
                 confidence=result.get("confidence"),
             )
@@ -258,17 +293,16 @@ Provide your prediction in JSON format."""
                 model_version=self.model_version,
             )
 
-        except json.JSONDecodeError as e:
-            logger.error(
+        except orjson.JSONDecodeError as e:
+            log.error(
                 "Failed to parse OpenAI response as JSON",
                 error=str(e),
                 content=content if 'content' in locals() else None,
             )
             raise ValueError(f"Invalid JSON response from OpenAI: {e}")
         except Exception as e:
-            logger.error(
+            log.error(
                 "Error during OpenAI analysis",
-                symbol=symbol,
                 error=str(e),
             )
             raise
@@ -1,6 +1,8 @@
 """CRUD operations for sentiment analysis."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.sentiment import SentimentAnalysis
@@ -13,16 +15,35 @@ class CRUDSentimentAnalysis(
 ):
     """CRUD operations for sentiment analysis."""
 
+    async def iter_by_news_article(
+        self, db: AsyncSession, *, news_article_id: int
+    ) -> AsyncIterator[SentimentAnalysis]:
+        """Stream sentiment analyses for a news article through a server-side cursor."""
+        result = await db.stream_scalars(
+            select(SentimentAnalysis)
+            .where(SentimentAnalysis.news_article_id == news_article_id)
+            .execution_options(yield_per=256)
+        )
+        async for analysis in result:
+            yield analysis
+
     async def get_by_news_article(
         self, db: AsyncSession, *, news_article_id: int
     ) -> list[SentimentAnalysis]:
         """Get sentiment analyses for a specific news article."""
+        return [
+            analysis
+            async for analysis in self.iter_by_news_article(db, news_article_id=news_article_id)
+        ]
+
+    async def exists_for_news_article(self, db: AsyncSession, *, news_article_id: int) -> bool:
+        """Check whether a news article has any sentiment analysis (``SELECT 1 ... LIMIT 1``)."""
         result = await db.execute(
-            select(SentimentAnalysis).where(
-                SentimentAnalysis.news_article_id == news_article_id
-            )
+            select(literal(1))
+            .where(SentimentAnalysis.news_article_id == news_article_id)
+            .limit(1)
         )
-        return list(result.scalars().all())
+        return result.first() is not None
 
     async def get_latest_by_news_article(
         self, db: AsyncSession, *, news_article_id: int
@@ -40,13 +61,14 @@ class CRUDSentimentAnalysis(
         self, db: AsyncSession, *, sentiment_label: str, skip: int = 0, limit: int = 100
     ) -> list[SentimentAnalysis]:
         """Get sentiment analyses by label."""
-        result = await db.execute(
+        result = await db.stream_scalars(
             select(SentimentAnalysis)
             .where(SentimentAnalysis.sentiment_label == sentiment_label)
             .offset(skip)
             .limit(limit)
+            .execution_options(yield_per=256)
         )
-        return list(result.scalars().all())
+        return [analysis async for analysis in result]
 
 
 # Singleton instance
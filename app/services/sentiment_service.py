@@ -1,17 +1,77 @@
 """Business logic for sentiment analysis using OpenAI."""
 
-import json
+import asyncio
 from typing import Any
 
+import orjson
 import structlog
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
 from app.core.config import settings
+from app.core.openai_client import collect_stream, get_openai_client
 from app.schemas.sentiment import SentimentAnalysisRequest, SentimentAnalysisResult
+from app.services._llm_cache import CachedCompletion, completion_key, get_or_call
 
 logger = structlog.get_logger()
 
+# The texts being scored never go in these prompts, which lets single and
+# batched sentiment calls each reuse a cached system prompt
+_SENTIMENT_SYSTEM_PROMPT = """You are an expert financial sentiment analyzer specializing in cryptocurrency and trading news.
+
+Analyze the sentiment of the given text and respond with a JSON object containing:
+- sentiment_label: one of "bullish", "bearish", "neutral", "positive", or "negative"
+- sentiment_score: a float between 0.0 (most negative/bearish) and 1.0 (most positive/bullish)
+- confidence: a float between 0.0 and 1.0 indicating your confidence in the analysis
+- key_factors: a list of 2-3 key phrases or factors that influenced your decision
+
+Consider:
+- Financial terminology (bull/bear markets, support/resistance, etc.)
+- Price action indicators (surge, crash, rally, decline)
+- Market sentiment indicators (fear, greed, uncertainty, confidence)
+- News impact (adoption, regulation, partnerships, security issues)
+
+Respond ONLY with valid JSON, no additional text."""
+
+# Crypto/financial specific keywords for the fallback analyzer, matched as whole
+# words so e.g. "bull" does not fire on "bulletin"
+_BULLISH_KEYWORDS = frozenset({
+    "bull", "bullish", "growth", "surge", "rally", "profit", "gain",
+    "positive", "up", "rise", "pump", "moon", "breakout", "support",
+    "buy", "accumulate", "hodl", "adoption", "partnership",
+})
+_BEARISH_KEYWORDS = frozenset({
+    "bear", "bearish", "decline", "crash", "drop", "loss", "negative",
+    "down", "fall", "dump", "dip", "breakdown", "resistance",
+    "sell", "fear", "panic", "regulation", "hack", "scam",
+})
+_NEUTRAL_KEYWORDS = frozenset({
+    "stable", "sideways", "consolidation", "range", "waiting",
+    "uncertain", "mixed", "flat",
+})
+
+# Punctuation stripped from the ends of each word before keyword lookup
+_TOKEN_PUNCTUATION = ".,!?;:()[]\"'"
+
+# Texts per batched OpenAI request; keeps the combined reply well within max_tokens
+_MAX_BATCH_TEXTS = 20
+
+_BATCH_SYSTEM_PROMPT = """You are an expert financial sentiment analyzer specializing in cryptocurrency and trading news.
+
+You will receive several texts, each introduced by a line "[n]". Analyze the sentiment of each text independently and respond with a JSON object {"results": [...]} containing one entry per text, in order, each with:
+- idx: the number n of the text
+- sentiment_label: one of "bullish", "bearish", "neutral", "positive", or "negative"
+- sentiment_score: a float between 0.0 (most negative/bearish) and 1.0 (most positive/bullish)
+- confidence: a float between 0.0 and 1.0 indicating your confidence in the analysis
+
+Consider:
+- Financial terminology (bull/bear markets, support/resistance, etc.)
+- Price action indicators (surge, crash, rally, decline)
+- Market sentiment indicators (fear, greed, uncertainty, confidence)
+- News impact (adoption, regulation, partnerships, security issues)
+
+Respond ONLY with valid JSON, no additional text."""
+
 
 class SentimentService:
     """Service for performing sentiment analysis using OpenAI GPT models."""
@@ -27,10 +87,13 @@ class SentimentService:
         self.max_tokens = settings.OPENAI_MAX_TOKENS
         self.temperature = settings.OPENAI_TEMPERATURE
         self.client: AsyncOpenAI | None = None
+        # Cascade counters: texts answered by the keyword analyzer / texts seen
+        self._cascade_hits = 0
+        self._cascade_total = 0
         
         # Initialize OpenAI client if API key is available
         if settings.OPENAI_API_KEY:
-            self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = get_openai_client()
             logger.info(
                 "OpenAI client initialized",
                 model=self.model_version,
@@ -54,11 +117,123 @@ class SentimentService:
         """
         # Use OpenAI if available, otherwise fall back to keyword-based analysis
         if self.client and settings.OPENAI_API_KEY:
+            if settings.ENABLE_LLM_CASCADE:
+                # Confident keyword results skip the OpenAI call entirely
+                cheap = self._keyword_sentiment(request, log=False)
+                self._cascade_total += 1
+                if cheap.confidence >= settings.CASCADE_CONFIDENCE_THRESHOLD:
+                    self._cascade_hits += 1
+                    logger.info(
+                        "Sentiment cascade answered with keyword analyzer",
+                        sentiment=cheap.sentiment_label,
+                        confidence=cheap.confidence,
+                        hit_rate=round(self._cascade_hits / self._cascade_total, 3),
+                    )
+                    return cheap.model_copy(update={"model_version": "cascade-keyword"})
             return await self._analyze_with_openai(request)
         else:
             logger.info("Using fallback keyword-based sentiment analysis")
             return await self._analyze_with_keywords(request)
 
+    async def analyze_texts_batch(
+        self, requests: list[SentimentAnalysisRequest]
+    ) -> list[SentimentAnalysisResult]:
+        """
+        Analyze sentiment of several texts, sending up to 20 per OpenAI request.
+
+        The instructions are sent once per request rather than once per text.
+        Texts missing from a batched reply are analyzed individually.
+
+        Args:
+            requests: Texts to analyze
+
+        Returns:
+            One SentimentAnalysisResult per request, in order
+        """
+        if not (self.client and settings.OPENAI_API_KEY):
+            # Scored inline with one log line for the whole batch
+            results = [self._keyword_sentiment(request, log=False) for request in requests]
+            logger.info(
+                "Keyword-based batch sentiment analysis completed", batch_size=len(results)
+            )
+            return results
+
+        chunks = [
+            requests[i : i + _MAX_BATCH_TEXTS] for i in range(0, len(requests), _MAX_BATCH_TEXTS)
+        ]
+        chunk_results = await asyncio.gather(*(self._analyze_batch_with_openai(c) for c in chunks))
+        return [result for results in chunk_results for result in results]
+
+    async def _analyze_batch_with_openai(
+        self, requests: list[SentimentAnalysisRequest]
+    ) -> list[SentimentAnalysisResult]:
+        """Analyze a chunk of texts with a single OpenAI request."""
+        if len(requests) == 1:
+            return [await self._analyze_with_openai(requests[0])]
+
+        texts = "\n\n".join(f"[{idx}] {request.text}" for idx, request in enumerate(requests, 1))
+        user_prompt = f"Analyze the sentiment of each of these {len(requests)} texts:\n\n{texts}"
+        logger.info(
+            "Calling OpenAI API for batched sentiment analysis",
+            model=self.model_version,
+            batch_size=len(requests),
+        )
+
+        async def _call() -> CachedCompletion:
+            response: ChatCompletion = await self.client.chat.completions.create(
+                model=self.model_version,
+                messages=[
+                    {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens * len(requests),
+                response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": "sentiment_batch"},
+            )
+            return CachedCompletion(response.choices[0].message.content or "", response.model)
+
+        by_idx: dict[int, dict[str, Any]] = {}
+        model = self.model_version
+        try:
+            cache_key = completion_key(
+                self.model_version, self.temperature, _BATCH_SYSTEM_PROMPT, user_prompt
+            )
+            content, model = await get_or_call(cache_key, _call)
+            items = orjson.loads(content)["results"] if content else []
+            for item in items if isinstance(items, list) else []:
+                if isinstance(item, dict) and isinstance(item.get("idx"), int):
+                    by_idx.setdefault(item["idx"], item)
+        except Exception as e:
+            logger.warning(
+                "Batched sentiment analysis failed, analyzing texts individually",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+        results: dict[int, SentimentAnalysisResult] = {}
+        for idx in range(len(requests)):
+            item = by_idx.get(idx + 1)
+            if item is None:
+                continue
+            try:
+                results[idx] = SentimentAnalysisResult(
+                    sentiment_label=str(item.get("sentiment_label", "neutral")).lower(),
+                    sentiment_score=max(0.0, min(1.0, float(item.get("sentiment_score", 0.5)))),
+                    confidence=max(0.0, min(1.0, float(item.get("confidence", 0.8)))),
+                    model_version=model,
+                )
+            except (TypeError, ValueError) as e:
+                logger.warning("Invalid batched sentiment result", idx=idx + 1, error=str(e))
+
+        missing = [idx for idx in range(len(requests)) if idx not in results]
+        if missing:
+            retried = await asyncio.gather(
+                *(self._analyze_with_openai(requests[idx]) for idx in missing)
+            )
+            results.update(zip(missing, retried))
+        return [results[idx] for idx in range(len(requests))]
+
     async def _analyze_with_openai(
         self, request: SentimentAnalysisRequest
     ) -> SentimentAnalysisResult:
@@ -69,23 +244,6 @@ class SentimentService:
         sentiment classification for financial/crypto news.
         """
         try:
-            # Construct prompt for crypto/financial sentiment analysis
-            system_prompt = """You are an expert financial sentiment analyzer specializing in cryptocurrency and trading news.
-
-Analyze the sentiment of the given text and respond with a JSON object containing:
-- sentiment_label: one of "bullish", "bearish", "neutral", "positive", or "negative"
-- sentiment_score: a float between 0.0 (most negative/bearish) and 1.0 (most positive/bullish)
-- confidence: a float between 0.0 and 1.0 indicating your confidence in the analysis
-- key_factors: a list of 2-3 key phrases or factors that influenced your decision
-
-Consider:
-- Financial terminology (bull/bear markets, support/resistance, etc.)
-- Price action indicators (surge, crash, rally, decline)
-- Market sentiment indicators (fear, greed, uncertainty, confidence)
-- News impact (adoption, regulation, partnerships, security issues)
-
-Respond ONLY with valid JSON, no additional text."""
-
             user_prompt = f"Analyze the sentiment of this text:\n\n{request.text}"
 
             # Call OpenAI API with server-controlled model version
@@ -95,42 +253,43 @@ Respond ONLY with valid JSON, no additional text."""
                 text_length=len(request.text),
             )
 
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.model_version,  # Use server-controlled model only
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,  # From settings
-                max_tokens=self.max_tokens,    # From settings
-                response_format={"type": "json_object"},  # Ensure JSON response
+            async def _call() -> CachedCompletion:
+                stream = await self.client.chat.completions.create(
+                    model=self.model_version,  # Use server-controlled model only
+                    messages=[
+                        {"role": "system", "content": _SENTIMENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=self.temperature,  # From settings
+                    max_tokens=self.max_tokens,    # From settings
+                    response_format={"type": "json_object"},  # Ensure JSON response
+                    # Routes calls sharing this prefix to the same prompt cache
+                    extra_body={"prompt_cache_key": "sentiment"},
+                    stream=True,
+                )
+                return CachedCompletion(*await collect_stream(stream, self.model_version))
+
+            # Identical texts reuse an earlier completion instead of calling OpenAI again
+            cache_key = completion_key(
+                self.model_version, self.temperature, _SENTIMENT_SYSTEM_PROMPT, user_prompt
             )
+            content, model = await get_or_call(cache_key, _call)
 
             # Parse the response
-            content = response.choices[0].message.content
             if not content:
                 raise ValueError("Empty response from OpenAI")
 
-            result_data = json.loads(content)
+            result_data = orjson.loads(content)
 
             # Extract and validate data
             sentiment_label = result_data.get("sentiment_label", "neutral").lower()
             sentiment_score = float(result_data.get("sentiment_score", 0.5))
             confidence = float(result_data.get("confidence", 0.8))
-            key_factors = result_data.get("key_factors", [])
 
             # Normalize sentiment score to 0-1 range
             sentiment_score = max(0.0, min(1.0, sentiment_score))
             confidence = max(0.0, min(1.0, confidence))
 
-            # Build metadata
-            metadata = json.dumps({
-                "key_factors": key_factors,
-                "model": response.model,
-                "tokens_used": response.usage.total_tokens if response.usage else 0,
-                "finish_reason": response.choices[0].finish_reason,
-            })
-
             logger.info(
                 "OpenAI sentiment analysis completed",
                 sentiment=sentiment_label,
@@ -142,10 +301,10 @@ Respond ONLY with valid JSON, no additional text."""
                 sentiment_label=sentiment_label,
                 sentiment_score=sentiment_score,
                 confidence=confidence,
-                model_version=response.model,
+                model_version=model,
             )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to parse OpenAI response as JSON", error=str(e))
             # Fall back to keyword-based analysis
             return await self._analyze_with_keywords(request)
@@ -167,28 +326,24 @@ Respond ONLY with valid JSON, no additional text."""
 
         Used when OpenAI API is not available or fails.
         """
-        text = request.text.lower()
+        return self._keyword_sentiment(request)
 
-        # Crypto/financial specific keywords
-        bullish_keywords = [
-            "bull", "bullish", "growth", "surge", "rally", "profit", "gain",
-            "positive", "up", "rise", "pump", "moon", "breakout", "support",
-            "buy", "accumulate", "hodl", "adoption", "partnership"
-        ]
-        bearish_keywords = [
-            "bear", "bearish", "decline", "crash", "drop", "loss", "negative",
-            "down", "fall", "dump", "dip", "breakdown", "resistance",
-            "sell", "fear", "panic", "regulation", "hack", "scam"
-        ]
-        neutral_keywords = [
-            "stable", "sideways", "consolidation", "range", "waiting",
-            "uncertain", "mixed", "flat"
-        ]
+    def _keyword_sentiment(
+        self, request: SentimentAnalysisRequest, *, log: bool = True
+    ) -> SentimentAnalysisResult:
+        """
+        Score a text against the keyword sets.
 
-        # Count keyword occurrences
-        bullish_count = sum(1 for keyword in bullish_keywords if keyword in text)
-        bearish_count = sum(1 for keyword in bearish_keywords if keyword in text)
-        neutral_count = sum(1 for keyword in neutral_keywords if keyword in text)
+        Synchronous so batch callers can score many texts without a coroutine
+        and log line per text.
+        """
+        words = request.text.lower().split()
+        tokens = {word.strip(_TOKEN_PUNCTUATION) for word in words}
+
+        # Each keyword counts once however often it appears
+        bullish_count = len(tokens & _BULLISH_KEYWORDS)
+        bearish_count = len(tokens & _BEARISH_KEYWORDS)
+        neutral_count = len(tokens & _NEUTRAL_KEYWORDS)
 
         # Determine sentiment
         if bullish_count > bearish_count and bullish_count > neutral_count:
@@ -210,24 +365,24 @@ Respond ONLY with valid JSON, no additional text."""
 
         # Calculate confidence based on keyword density
         total_keywords = bullish_count + bearish_count + neutral_count
-        word_count = len(text.split())
-        keyword_density = total_keywords / max(word_count, 1)
+        keyword_density = total_keywords / max(len(words), 1)
         confidence = min(0.5 + (keyword_density * 2), 0.85)  # Cap at 0.85 for fallback
 
-        logger.info(
-            "Keyword-based sentiment analysis completed",
-            sentiment=sentiment_label,
-            score=sentiment_score,
-            bullish=bullish_count,
-            bearish=bearish_count,
-            neutral=neutral_count,
-        )
+        if log:
+            logger.info(
+                "Keyword-based sentiment analysis completed",
+                sentiment=sentiment_label,
+                score=sentiment_score,
+                bullish=bullish_count,
+                bearish=bearish_count,
+                neutral=neutral_count,
+            )
 
         return SentimentAnalysisResult(
             sentiment_label=sentiment_label,
             sentiment_score=sentiment_score,
             confidence=confidence,
-            model_version=f"keyword-fallback-{request.model_version or 'v1.0.0'}",
+            model_version="keyword-fallback-v1.0.0",
         )
 
 
@@ -12,9 +12,12 @@ import httpx
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# Maximum requests in flight at once from the concurrent examples
+MAX_CONCURRENT_REQUESTS = 20
 
-async def quick_analysis_example():
-    """Example: Quick sentiment analysis without database storage."""
+
+async def quick_analysis_example(client: httpx.AsyncClient):
+    """Example: Quick sentiment analysis without database storage (requests sent concurrently)."""
     print("\n=== Quick Analysis Example ===\n")
 
     texts = [
@@ -23,23 +26,28 @@ async def quick_analysis_example():
         "Ethereum trading sideways, waiting for catalyst",
     ]
 
-    async with httpx.AsyncClient() as client:
-        for text in texts:
-            print(f"Analyzing: {text[:50]}...")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
+    async def analyze(text: str) -> dict:
+        async with semaphore:
             response = await client.post(
                 f"{BASE_URL}/ai/analyze/quick",
                 params={"text": text, "use_openai": True},
             )
+            return response.json()
+
+    # Total time is the slowest request rather than the sum of all of them
+    results = await asyncio.gather(*(analyze(text) for text in texts))
 
-            result = response.json()
-            print(f"  Sentiment: {result['sentiment_label']}")
-            print(f"  Score: {result['sentiment_score']:.2f}")
-            print(f"  Confidence: {result['confidence']:.2f}")
-            print(f"  Model: {result['model_version']}\n")
+    for text, result in zip(texts, results):
+        print(f"Analyzed: {text[:50]}...")
+        print(f"  Sentiment: {result['sentiment_label']}")
+        print(f"  Score: {result['sentiment_score']:.2f}")
+        print(f"  Confidence: {result['confidence']:.2f}")
+        print(f"  Model: {result['model_version']}\n")
 
 
-async def batch_analysis_example():
+async def batch_analysis_example(client: httpx.AsyncClient):
     """Example: Batch analysis of multiple texts."""
     print("\n=== Batch Analysis Example ===\n")
 
@@ -49,102 +57,103 @@ async def batch_analysis_example():
         "Stable price action today",
     ]
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/ai/analyze/batch",
-            json={"texts": texts, "model_version": "gpt-4o-mini"},
-        )
+    response = await client.post(
+        f"{BASE_URL}/ai/analyze/batch",
+        json={"texts": texts, "model_version": "gpt-4o-mini"},
+    )
 
-        results = response.json()
-        for i, result in enumerate(results, 1):
-            print(f"{i}. \"{texts[i-1]}\"")
-            print(f"   → {result['sentiment_label']} ({result['sentiment_score']:.2f})\n")
+    results = response.json()
+    for i, result in enumerate(results, 1):
+        print(f"{i}. \"{texts[i-1]}\"")
+        print(f"   → {result['sentiment_label']} ({result['sentiment_score']:.2f})\n")
 
 
-async def news_article_workflow():
+async def news_article_workflow(client: httpx.AsyncClient):
     """Example: Complete workflow with news article."""
     print("\n=== News Article Workflow Example ===\n")
 
-    async with httpx.AsyncClient() as client:
-        # 1. Create a news article
-        print("1. Creating news article...")
-        article_data = {
-            "title": "Bitcoin ETF Approval Drives Major Rally",
-            "content": """
-            Bitcoin surged to new all-time highs following the approval of spot Bitcoin ETFs.
-            Institutional investors are flooding into the market, with record inflows reported.
-            Analysts predict continued bullish momentum as adoption accelerates.
-            """,
-            "source": "CryptoNews",
-            "url": "https://example.com/btc-etf-rally",
-            "category": "cryptocurrency",
-        }
-
-        article_response = await client.post(
-            f"{BASE_URL}/news",
-            json=article_data,
+    # 1. Create a news article
+    print("1. Creating news article...")
+    article_data = {
+        "title": "Bitcoin ETF Approval Drives Major Rally",
+        "content": """
+        Bitcoin surged to new all-time highs following the approval of spot Bitcoin ETFs.
+        Institutional investors are flooding into the market, with record inflows reported.
+        Analysts predict continued bullish momentum as adoption accelerates.
+        """,
+        "source": "CryptoNews",
+        "url": "https://example.com/btc-etf-rally",
+        "category": "cryptocurrency",
+    }
+
+    article_response = await client.post(
+        f"{BASE_URL}/news",
+        json=article_data,
+    )
+
+    if article_response.status_code == 201:
+        article = article_response.json()
+        article_id = article["id"]
+        print(f"   Article created with ID: {article_id}\n")
+
+        # 2. Analyze the article
+        print("2. Analyzing article sentiment...")
+        analysis_response = await client.post(
+            f"{BASE_URL}/ai/analyze/news/{article_id}"
         )
 
-        if article_response.status_code == 201:
-            article = article_response.json()
-            article_id = article["id"]
-            print(f"   Article created with ID: {article_id}\n")
+        if analysis_response.status_code == 201:
+            analysis = analysis_response.json()
+            print(f"   Sentiment: {analysis['sentiment_label']}")
+            print(f"   Score: {analysis['sentiment_score']:.2f}")
+            print(f"   Confidence: {analysis['confidence']:.2f}\n")
 
-            # 2. Analyze the article
-            print("2. Analyzing article sentiment...")
-            analysis_response = await client.post(
-                f"{BASE_URL}/ai/analyze/news/{article_id}"
+            # 3. Retrieve the analysis
+            print("3. Retrieving latest analysis...")
+            latest_response = await client.get(
+                f"{BASE_URL}/ai/news/{article_id}/latest"
             )
 
-            if analysis_response.status_code == 201:
-                analysis = analysis_response.json()
-                print(f"   Sentiment: {analysis['sentiment_label']}")
-                print(f"   Score: {analysis['sentiment_score']:.2f}")
-                print(f"   Confidence: {analysis['confidence']:.2f}\n")
-
-                # 3. Retrieve the analysis
-                print("3. Retrieving latest analysis...")
-                latest_response = await client.get(
-                    f"{BASE_URL}/ai/news/{article_id}/latest"
-                )
-
-                if latest_response.status_code == 200:
-                    latest = latest_response.json()
-                    print(f"   Found analysis ID: {latest['id']}")
-                    print(f"   Created at: {latest['created_at']}\n")
-        else:
-            print(f"   Error: {article_response.status_code}")
-            print(f"   {article_response.text}")
+            if latest_response.status_code == 200:
+                latest = latest_response.json()
+                print(f"   Found analysis ID: {latest['id']}")
+                print(f"   Created at: {latest['created_at']}\n")
+    else:
+        print(f"   Error: {article_response.status_code}")
+        print(f"   {article_response.text}")
 
 
-async def fallback_comparison():
+async def fallback_comparison(client: httpx.AsyncClient):
     """Example: Compare OpenAI vs keyword fallback."""
     print("\n=== OpenAI vs Keyword Fallback Comparison ===\n")
 
     text = "Bitcoin price surges 20% on institutional adoption news"
 
-    async with httpx.AsyncClient() as client:
-        # With OpenAI
-        print("Using OpenAI:")
-        openai_response = await client.post(
+    # Both variants run concurrently
+    openai_response, keyword_response = await asyncio.gather(
+        client.post(
             f"{BASE_URL}/ai/analyze/quick",
             params={"text": text, "use_openai": True},
-        )
-        openai_result = openai_response.json()
-        print(f"  Sentiment: {openai_result['sentiment_label']}")
-        print(f"  Score: {openai_result['sentiment_score']:.2f}")
-        print(f"  Confidence: {openai_result['confidence']:.2f}\n")
-
-        # With keyword fallback
-        print("Using Keyword Fallback:")
-        keyword_response = await client.post(
+        ),
+        client.post(
             f"{BASE_URL}/ai/analyze/quick",
             params={"text": text, "use_openai": False},
-        )
-        keyword_result = keyword_response.json()
-        print(f"  Sentiment: {keyword_result['sentiment_label']}")
-        print(f"  Score: {keyword_result['sentiment_score']:.2f}")
-        print(f"  Confidence: {keyword_result['confidence']:.2f}\n")
+        ),
+    )
+
+    # With OpenAI
+    print("Using OpenAI:")
+    openai_result = openai_response.json()
+    print(f"  Sentiment: {openai_result['sentiment_label']}")
+    print(f"  Score: {openai_result['sentiment_score']:.2f}")
+    print(f"  Confidence: {openai_result['confidence']:.2f}\n")
+
+    # With keyword fallback
+    print("Using Keyword Fallback:")
+    keyword_result = keyword_response.json()
+    print(f"  Sentiment: {keyword_result['sentiment_label']}")
+    print(f"  Score: {keyword_result['sentiment_score']:.2f}")
+    print(f"  Confidence: {keyword_result['confidence']:.2f}\n")
 
 
 async def main():
@@ -154,11 +163,15 @@ async def main():
     print("=" * 60)
 
     try:
-        # Run examples
-        await quick_analysis_example()
-        await batch_analysis_example()
-        await fallback_comparison()
-        # await news_article_workflow()  # Uncomment if you want to create articles
+        # One client (and connection pool) shared by every example
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100), timeout=60.0
+        ) as client:
+            # Run examples
+            await quick_analysis_example(client)
+            await batch_analysis_example(client)
+            await fallback_comparison(client)
+            # await news_article_workflow(client)  # Uncomment if you want to create articles
 
         print("\n" + "=" * 60)
         print("Examples completed successfully!")
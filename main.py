@@ -4,6 +4,7 @@ AI Service API - Main application entry point.
 Production-ready FastAPI application for crypto trading analysis.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -12,20 +13,32 @@ import uvicorn
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request as StarletteRequest
+from starlette.datastructures import Headers
 from starlette.responses import Response
-from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1.router import api_router
+from app.core.cache import close_redis
 from app.core.config import settings
 from app.core.exceptions import AppException
+from app.core.log import configure_logging, flush_logging
+from app.core.openai_client import close_openai
+from app.core.responses import ORJSONResponse, StaticJSONResponse
 from app.db.session import async_engine
 from app.db.models import Base  # noqa: F401 – import so all models are registered
+from app.services.chat_service import chat_service
+from app.services.html_parser_service import html_parser_service
+from app.services.prediction_line_service import prediction_line_service
+from app.services.price_prediction_service import price_prediction_service
 
 # Configure structured logging
+configure_logging()
 logger = structlog.get_logger()
 
+# Debug tracebacks and the reloader never run in production, even if DEBUG is
+# set there by mistake
+_DEBUG = settings.DEBUG and settings.ENVIRONMENT != "production"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -37,14 +50,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     logger.info("Starting up AI Service API", version=settings.APP_VERSION)
 
-    # Auto-create all tables that don't exist yet (safe for production – uses IF NOT EXISTS)
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables verified / created")
-
-    # Initialize database connection pool
-    # The engine is already created in app.db.session
-    logger.info("Database connection pool initialized")
+    # Auto-create all tables that don't exist yet (uses IF NOT EXISTS). Off outside
+    # development by default, where Alembic owns the schema and every worker
+    # would otherwise repeat the introspection on boot
+    if settings.CREATE_TABLES_ON_STARTUP:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("Database tables verified / created")
+
+    # Pre-warm a few pool connections so the first requests after startup don't
+    # pay for connecting; a failure here is logged rather than aborting startup
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(min(settings.DATABASE_POOL_SIZE, 5))),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if not isinstance(result, BaseException)]
+    await asyncio.gather(*(connection.close() for connection in connections))
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        logger.warning(
+            "Database connection pool pre-warm failed",
+            failed=len(failures),
+            error=str(failures[0]),
+        )
+    logger.info("Database connection pool initialized", connections=len(connections))
 
     yield
 
@@ -55,8 +84,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await async_engine.dispose()
     logger.info("Database connections closed")
 
+    # Close shared HTTP clients
+    await chat_service.aclose()
+    await html_parser_service.aclose()
+    await prediction_line_service.aclose()
+    await price_prediction_service.aclose()
+    await close_openai()
+    logger.info("HTTP clients closed")
+
+    # Close Redis connections
+    await close_redis()
+    logger.info("Redis connections closed")
+
+    # Flush queued log lines and stop the writer thread
+    flush_logging()
+
     # Add more cleanup tasks here:
-    # - Close Redis connections
     # - Save state
     # - Cancel background tasks
 
@@ -79,34 +122,57 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     lifespan=lifespan,
-    debug=settings.DEBUG,
+    debug=_DEBUG,
 )
 
 
 # Custom CORS middleware that skips adding CORS headers when request comes from Gateway
 # This prevents duplicate CORS headers (Gateway already adds them)
-class ConditionalCORSMiddleware(BaseHTTPMiddleware):
+class ConditionalCORSMiddleware:
     """
     Only add CORS headers if the request does NOT come from the Gateway.
     Gateway adds X-Gateway-Validated header to indicate it has already handled CORS.
+
+    Pure ASGI middleware: headers are read from the scope and added to the
+    response start message, without building Request/Response objects.
     """
-    async def dispatch(self, request: StarletteRequest, call_next) -> Response:
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Settings don't change at runtime, so the checks and header values are fixed here
+        self._allow_all = "*" in settings.CORS_ORIGINS
+        self._allowed_origins = frozenset(settings.CORS_ORIGINS)
+        self._cors_headers = [
+            (b"access-control-allow-origin", b"*"),
+            (b"access-control-allow-credentials", b"false"),
+            (b"access-control-allow-methods", b"*"),
+            (b"access-control-allow-headers", b"*"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
         # Check if request comes from Gateway (has X-Gateway-Validated header)
-        is_from_gateway = request.headers.get("X-Gateway-Validated") == "true"
-        
-        response = await call_next(request)
-        
+        if headers.get("x-gateway-validated") == "true":
+            await self.app(scope, receive, send)
+            return
+
         # Only add CORS headers if NOT from gateway (e.g., direct access for health checks)
-        if not is_from_gateway:
-            origin = request.headers.get("origin")
-            # Allow all origins with wildcard
-            if "*" in settings.CORS_ORIGINS or (origin and origin in settings.CORS_ORIGINS):
-                response.headers["Access-Control-Allow-Origin"] = "*"
-                response.headers["Access-Control-Allow-Credentials"] = "false"
-                response.headers["Access-Control-Allow-Methods"] = "*"
-                response.headers["Access-Control-Allow-Headers"] = "*"
-        
-        return response
+        origin = headers.get("origin")
+        # Allow all origins with wildcard
+        if not (self._allow_all or (origin and origin in self._allowed_origins)):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self._cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
 
 # Use conditional CORS middleware instead of default CORSMiddleware
 app.add_middleware(ConditionalCORSMiddleware)
@@ -114,7 +180,7 @@ app.add_middleware(ConditionalCORSMiddleware)
 
 # Custom exception handlers
 @app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
     """Handle custom application exceptions."""
     logger.error(
         "Application exception",
@@ -123,7 +189,7 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
         details=exc.details,
         path=request.url.path,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.message,
@@ -136,32 +202,34 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
+    # Build the error list once and share it between the log and the body
+    errors = exc.errors()
     logger.warning(
         "Validation error",
-        errors=exc.errors(),
+        errors=errors,
         path=request.url.path,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "detail": "Validation error",
             "error_code": "VALIDATION_ERROR",
-            "errors": exc.errors(),
+            "errors": errors,
         },
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle all unhandled exceptions."""
     logger.exception(
         "Unhandled exception",
         exception=str(exc),
         path=request.url.path,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -175,19 +243,25 @@ app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 
 # Root endpoint
-@app.get("/", tags=["Root"])
-async def root() -> dict[str, str]:
+_ROOT_RESPONSE = StaticJSONResponse(
+    {
+        "message": "AI Service API",
+        "version": settings.APP_VERSION,
+        "docs": "/docs",
+        "health": f"{settings.API_V1_PREFIX}/health",
+    },
+    cache_control="public, max-age=60",
+)
+
+
+@app.get("/", tags=["Root"], response_model=dict[str, str])
+async def root(request: Request) -> Response:
     """
     Root endpoint providing API information.
     
     Returns basic information about the API service.
     """
-    return {
-        "message": "AI Service API",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "health": f"{settings.API_V1_PREFIX}/health",
-    }
+    return _ROOT_RESPONSE(request)
 
 
 if __name__ == "__main__":
@@ -197,7 +271,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG,
+        reload=_DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
     )
 
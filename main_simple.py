@@ -1,21 +1,98 @@
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import Response
+from functools import lru_cache, partial
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
+import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="Crypto News AI Analyzer",
-    description="AI-powered sentiment analysis and news analysis for cryptocurrency",
-    version="1.0.0"
-)
-
 # Global variables for models (lazy loading)
 sentiment_analyzer = None
 ner_model = None
+sentiment_batcher = None
+ner_batcher = None
+
+# Dedicated, bounded pool for model forward passes so inference neither blocks
+# the event loop nor oversubscribes the CPU
+_INFER_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="infer")
+
+class MicroBatcher:
+    """Collect concurrent pipeline inputs into one batched forward pass"""
+
+    def __init__(self, pipe, max_batch_size: int = 16, max_wait: float = 0.005, **call_kwargs):
+        self.pipe = pipe
+        # Extra pipeline call arguments (e.g. truncation for text classification)
+        self.call_kwargs = call_kwargs
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.task
+
+    async def submit(self, text: str):
+        """Queue one input and wait for its result from the next batch"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first input, then collect more for up to max_wait
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Without batch_size the pipeline runs one forward pass per input;
+            # with it the inputs are padded into a single tensor
+            infer = partial(self.pipe, batch_size=len(batch), **self.call_kwargs)
+            try:
+                results = await loop.run_in_executor(
+                    _INFER_POOL, infer, [text for text, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+def quantize_pipeline(pipe):
+    """Swap the pipeline's Linear layers for int8 dynamically quantized ones (CPU)"""
+    try:
+        import torch
+        pipe.model = torch.quantization.quantize_dynamic(
+            pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:
+        logger.warning(f"Dynamic quantization unavailable, keeping FP32 model: {e}")
+    return pipe
 
 def load_models():
     """Load AI models on startup"""
@@ -24,29 +101,38 @@ def load_models():
     try:
         logger.info("Loading AI models...")
         
+        # One torch thread per process: scale with uvicorn workers instead of
+        # letting concurrent forward passes oversubscribe the cores
+        try:
+            import torch
+            torch.set_num_threads(1)
+            torch.set_num_interop_threads(1)
+        except Exception as e:
+            logger.warning(f"Could not pin torch threads: {e}")
+        
         # Try to load FinBERT for sentiment analysis
         try:
             from transformers import pipeline
-            sentiment_analyzer = pipeline(
+            sentiment_analyzer = quantize_pipeline(pipeline(
                 "sentiment-analysis",
                 model="ProsusAI/finbert",
                 device=-1  # Use CPU (-1) or GPU (0)
-            )
+            ))
             logger.info("FinBERT sentiment analyzer loaded successfully!")
         except Exception as e:
             logger.warning(f"Failed to load FinBERT: {e}")
             logger.info("Using fallback sentiment analyzer...")
             from transformers import pipeline
-            sentiment_analyzer = pipeline("sentiment-analysis")
+            sentiment_analyzer = quantize_pipeline(pipeline("sentiment-analysis"))
         
         # Try to load NER model
         try:
             from transformers import pipeline
-            ner_model = pipeline(
+            ner_model = quantize_pipeline(pipeline(
                 "ner",
                 model="dslim/bert-base-NER",
                 device=-1
-            )
+            ))
             logger.info("NER model loaded successfully!")
         except Exception as e:
             logger.warning(f"Failed to load NER model: {e}")
@@ -58,10 +144,35 @@ def load_models():
         logger.error(f"Failed to load models: {e}")
         logger.info("Service will start but AI features may be limited")
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize models on startup"""
-    load_models()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize models on startup without blocking the event loop"""
+    global sentiment_batcher, ner_batcher
+    await asyncio.to_thread(load_models)
+
+    # Concurrent requests share batched forward passes
+    batchers = []
+    if sentiment_analyzer:
+        sentiment_batcher = MicroBatcher(sentiment_analyzer, truncation=True)
+        batchers.append(sentiment_batcher)
+    if ner_model:
+        ner_batcher = MicroBatcher(ner_model)
+        batchers.append(ner_batcher)
+    for batcher in batchers:
+        batcher.start()
+
+    yield
+
+    for batcher in batchers:
+        await batcher.stop()
+    _INFER_POOL.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(
+    title="Crypto News AI Analyzer",
+    description="AI-powered sentiment analysis and news analysis for cryptocurrency",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # Request/Response Models
 class SentimentRequest(BaseModel):
@@ -94,23 +205,38 @@ class PriceImpactResponse(BaseModel):
     reasoning: str
 
 # Endpoints
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
+# Constant bodies are serialized once instead of on every hit
+_ROOT_RESPONSE = Response(
+    content=json.dumps({
         "service": "Crypto News AI Analyzer",
         "version": "1.0.0",
         "status": "running"
-    }
+    }),
+    media_type="application/json",
+    headers={"Cache-Control": "public, max-age=60"}
+)
+
+@lru_cache(maxsize=4)
+def _health_response(sentiment_loaded: bool, ner_loaded: bool) -> Response:
+    """Health body for one combination of loaded models"""
+    return Response(
+        content=json.dumps({
+            "status": "healthy",
+            "sentiment_model_loaded": sentiment_loaded,
+            "ner_model_loaded": ner_loaded
+        }),
+        media_type="application/json"
+    )
+
+@app.get("/")
+async def root():
+    """Root endpoint"""
+    return _ROOT_RESPONSE
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "sentiment_model_loaded": sentiment_analyzer is not None,
-        "ner_model_loaded": ner_model is not None
-    }
+    return _health_response(sentiment_analyzer is not None, ner_model is not None)
 
 @app.post("/analyze/sentiment", response_model=SentimentResponse)
 async def analyze_sentiment(request: SentimentRequest):
@@ -123,14 +249,14 @@ async def analyze_sentiment(request: SentimentRequest):
         text = request.text[:512]
         
         # Analyze sentiment
-        result = sentiment_analyzer(text)
+        result = await sentiment_batcher.submit(text)
         
         # Extract keywords (simple version)
         keywords = extract_keywords(request.text)
         
         # Convert label to standardized format
-        label = result[0]["label"].lower()
-        score = result[0]["score"]
+        label = result["label"].lower()
+        score = result["score"]
         
         # Map FinBERT labels to standard labels
         if label in ["positive", "bullish"]:
@@ -174,7 +300,7 @@ async def extract_entities(request: EntityRequest):
         text = request.text[:512]
         
         # Extract entities
-        entities = ner_model(text)
+        entities = await ner_batcher.submit(text)
         
         # Extract cryptocurrencies from entities
         cryptos = extract_crypto_from_entities(entities)
@@ -206,11 +332,11 @@ async def analyze_price_impact(request: PriceImpactRequest):
     
     try:
         # First get sentiment
-        sentiment_result = sentiment_analyzer(request.text[:512])
+        sentiment_result = await sentiment_batcher.submit(request.text[:512])
         
         # Map sentiment to price impact
-        label = sentiment_result[0]["label"].lower()
-        confidence = sentiment_result[0]["score"]
+        label = sentiment_result["label"].lower()
+        confidence = sentiment_result["score"]
         
         # Determine direction
         if label in ["positive", "bullish"]:
@@ -253,63 +379,52 @@ async def analyze_price_impact(request: PriceImpactRequest):
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 # Helper functions
+# Important crypto-related keywords
+IMPORTANT_WORDS = [
+    "bitcoin", "ethereum", "btc", "eth", "crypto", "blockchain",
+    "surge", "rally", "crash", "fall", "bullish", "bearish",
+    "gain", "loss", "profit", "decline", "rise", "drop",
+    "regulation", "adoption", "partnership", "hack", "scam"
+]
+
+CRYPTO_SYMBOLS = [
+    "BTC", "ETH", "BNB", "XRP", "ADA", "SOL", "DOGE",
+    "DOT", "MATIC", "AVAX", "LINK", "LTC", "XLM", "XMR", "TRX"
+]
+
+CRYPTO_NAMES = {
+    "BITCOIN": "BTC",
+    "ETHEREUM": "ETH",
+    "BINANCE COIN": "BNB",
+    "RIPPLE": "XRP",
+    "CARDANO": "ADA",
+    "SOLANA": "SOL",
+    "DOGECOIN": "DOGE",
+    "POLKADOT": "DOT",
+    "POLYGON": "MATIC",
+    "AVALANCHE": "AVAX",
+    "CHAINLINK": "LINK",
+    "LITECOIN": "LTC",
+}
+
+# Lowercase term -> symbol, in the order symbols were reported (symbols, then names)
+_CRYPTO_TERMS = {symbol.lower(): symbol for symbol in CRYPTO_SYMBOLS}
+_CRYPTO_TERMS.update((name.lower(), symbol) for name, symbol in CRYPTO_NAMES.items())
+
+NER_CRYPTO_SYMBOLS = frozenset({"BTC", "ETH", "BNB", "XRP", "ADA", "SOL", "DOGE"})
+
 def extract_keywords(text: str) -> List[str]:
     """Extract important keywords from text"""
-    keywords = []
-    
-    # Important crypto-related keywords
-    important_words = [
-        "bitcoin", "ethereum", "btc", "eth", "crypto", "blockchain",
-        "surge", "rally", "crash", "fall", "bullish", "bearish",
-        "gain", "loss", "profit", "decline", "rise", "drop",
-        "regulation", "adoption", "partnership", "hack", "scam"
-    ]
-    
     text_lower = text.lower()
-    for word in important_words:
-        if word in text_lower:
-            keywords.append(word)
-    
-    return keywords
+    return [word for word in IMPORTANT_WORDS if word in text_lower]
 
 def extract_crypto_mentions(text: str) -> List[str]:
     """Extract cryptocurrency mentions from text"""
-    cryptos = []
-    text_upper = text.upper()
-    
-    crypto_list = [
-        "BTC", "ETH", "BNB", "XRP", "ADA", "SOL", "DOGE",
-        "DOT", "MATIC", "AVAX", "LINK", "LTC", "XLM", "XMR", "TRX"
-    ]
-    
-    crypto_names = {
-        "BITCOIN": "BTC",
-        "ETHEREUM": "ETH",
-        "BINANCE COIN": "BNB",
-        "RIPPLE": "XRP",
-        "CARDANO": "ADA",
-        "SOLANA": "SOL",
-        "DOGECOIN": "DOGE",
-        "POLKADOT": "DOT",
-        "POLYGON": "MATIC",
-        "AVALANCHE": "AVAX",
-        "CHAINLINK": "LINK",
-        "LITECOIN": "LTC",
-    }
-    
-    # Check direct symbols
-    for crypto in crypto_list:
-        if crypto in text_upper:
-            if crypto not in cryptos:
-                cryptos.append(crypto)
-    
-    # Check crypto names
-    for name, symbol in crypto_names.items():
-        if name in text_upper:
-            if symbol not in cryptos:
-                cryptos.append(symbol)
-    
-    return cryptos
+    text_lower = text.lower()
+    # dict.fromkeys drops repeat symbols (e.g. "BTC" and "Bitcoin") keeping first-seen order
+    return list(dict.fromkeys(
+        symbol for term, symbol in _CRYPTO_TERMS.items() if term in text_lower
+    ))
 
 def extract_crypto_from_entities(entities: List[dict]) -> List[str]:
     """Extract cryptocurrencies from NER entities"""
@@ -319,12 +434,13 @@ def extract_crypto_from_entities(entities: List[dict]) -> List[str]:
         word = entity.get("word", "").replace("##", "").upper()
         
         # Check if it's a known crypto
-        if word in ["BTC", "ETH", "BNB", "XRP", "ADA", "SOL", "DOGE"]:
-            if word not in cryptos:
-                cryptos.append(word)
+        if word in NER_CRYPTO_SYMBOLS and word not in cryptos:
+            cryptos.append(word)
     
     return cryptos
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker loads its own models and runs single-threaded inference;
+    # equivalent to `uvicorn main_simple:app --workers $(nproc)`
+    uvicorn.run("main_simple:app", host="0.0.0.0", port=8000, workers=os.cpu_count() or 1)